@@ -14,11 +14,13 @@ import logging
 from dataclasses import dataclass
 import os
 
+from ocr_processor import DATACLASS_SLOTS
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TextChunk:
     """Structured text chunk with spatial context"""
     text: str
@@ -28,7 +30,7 @@ class TextChunk:
     language: str = "mixed"
     chunk_type: str = "text"  # text, title, list_item, contact_info
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ContentTypeResult:
     """Content type detection result"""
     content_type: str  # social_media, travel_itinerary, map_screenshot, review, mixed
@@ -36,7 +38,7 @@ class ContentTypeResult:
     indicators: List[str]  # What indicated this content type
     language_detected: str  # en, zh, mixed
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnhancedOCRResult:
     """Enhanced OCR result with context preservation"""
     raw_text: str
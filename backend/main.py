@@ -1,8 +1,11 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import asyncio
 import os
 import tempfile
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
 from typing import List
 from dotenv import load_dotenv
 import uvicorn
@@ -16,19 +19,60 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# The server runs OCR in one worker process per core, so Tesseract's OpenMP
+# threading stays off. libgomp reads this when tesserocr is imported below, and
+# the spawned OCR workers inherit it.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 # Import OCR processor
 try:
-    from ocr_processor import process_image_file, ocr_processor
+    from ocr_processor import process_image_file, process_image_files, create_ocr_worker_pool, ocr_processor
     OCR_AVAILABLE = True
     logger.info("✅ OCR processor loaded")
 except ImportError as e:
     logger.error(f"❌ OCR processor not available: {e}")
     OCR_AVAILABLE = False
 
+# OCR worker processes for batch requests, started once with the server so each
+# worker loads its OCR engines once instead of per request
+ocr_worker_pool = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Keep the OCR worker pool running for the server's lifetime"""
+    global ocr_worker_pool
+    if OCR_AVAILABLE:
+        ocr_worker_pool = create_ocr_worker_pool()
+    try:
+        yield
+    finally:
+        if ocr_worker_pool is not None:
+            ocr_worker_pool.shutdown()
+            ocr_worker_pool = None
+
+async def run_ocr_batch(image_paths: List[str], engine: str):
+    """
+    process_image_files on the shared worker pool, off the event loop. A worker
+    crash breaks the whole pool, so a broken pool is replaced and the batch
+    retried once.
+    """
+    global ocr_worker_pool
+    pool = ocr_worker_pool
+    try:
+        return await asyncio.to_thread(process_image_files, image_paths, engine, executor=pool)
+    except BrokenProcessPool:
+        logger.warning("OCR worker pool broken, restarting it and retrying the batch")
+        # Another request may have replaced it already
+        if pool is not None and ocr_worker_pool is pool:
+            pool.shutdown(wait=False)
+            ocr_worker_pool = create_ocr_worker_pool()
+        return await asyncio.to_thread(process_image_files, image_paths, engine, executor=ocr_worker_pool)
+
 app = FastAPI(
     title="LLMap Backend API",
     description="AI-powered location extraction and mapping backend with advanced OCR",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -193,9 +237,10 @@ async def process_batch_ocr(
     try:
         logger.info(f"Starting batch processing of {len(files)} files")
         
+        # Save uploads to temporary files first so OCR can run as one parallel batch
+        pending_files = []  # (file_index, file, temp_file_path, size)
+        
         for i, file in enumerate(files):
-            logger.info(f"Processing file {i+1}/{len(files)}: {file.filename}")
-            
             # Validate file type
             if not file.content_type.startswith('image/'):
                 results.append({
@@ -215,52 +260,47 @@ async def process_batch_ocr(
                 processing_stats["failed_files"] += 1
                 continue
             
-            temp_file_path = None
-            
             try:
                 # Create temporary file
                 with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as temp_file:
+                    temp_files.append(temp_file.name)
                     content = await file.read()
                     temp_file.write(content)
-                    temp_file_path = temp_file.name
-                    temp_files.append(temp_file_path)
                 
-                # Process OCR
-                result = process_image_file(temp_file_path, engine)
+                pending_files.append((i, file, temp_file.name, len(content)))
                 
-                # Ensure result has all required fields
-                if not result.get("extracted_info"):
-                    result["extracted_info"] = {
+            except Exception as e:
+                logger.error(f"Error saving file {file.filename}: {e}")
+                results.append({
+                    "filename": file.filename,
+                    "success": False,
+                    "error": str(e),
+                    "file_index": i,
+                    "raw_text": "",
+                    "cleaned_text": "",
+                    "confidence": 0,
+                    "extracted_info": {
                         "locations": [],
                         "addresses": [],
                         "business_names": []
                     }
-                
-                # Add file information and index
-                result["file_index"] = i
-                result["processing_metadata"] = {
-                    "engine_used": engine,
-                    "image_enhanced": enhance_image,
-                    "structured_extraction": extract_structured,
-                    "processed_at": datetime.now().isoformat(),
-                    "file_info": {
-                        "filename": file.filename,
-                        "size": len(content),
-                        "content_type": file.content_type
-                    }
-                }
-                
-                results.append(result)
-                processing_stats["successful_files"] += 1
-                
-                logger.info(f"✅ File {file.filename} processing completed")
-                
-            except Exception as e:
-                logger.error(f"Error processing file {file.filename}: {e}")
+                })
+                processing_stats["failed_files"] += 1
+        
+        # Process OCR in the worker pool, off the event loop
+        logger.info(f"Running OCR on {len(pending_files)} files")
+        try:
+            batch_results = await run_ocr_batch([path for _, _, path, _ in pending_files], engine)
+        except Exception as e:
+            logger.error(f"Batch OCR failed: {e}")
+            batch_results = [e] * len(pending_files)
+        
+        for (i, file, _, size), result in zip(pending_files, batch_results):
+            if isinstance(result, Exception):
                 results.append({
                     "filename": file.filename,
                     "success": False,
-                    "error": str(e),
+                    "error": str(result),
                     "file_index": i,
                     "raw_text": "",
                     "cleaned_text": "",
@@ -272,6 +312,37 @@ async def process_batch_ocr(
                     }
                 })
                 processing_stats["failed_files"] += 1
+                continue
+            
+            # Ensure result has all required fields
+            if not result.get("extracted_info"):
+                result["extracted_info"] = {
+                    "locations": [],
+                    "addresses": [],
+                    "business_names": []
+                }
+            
+            # Add file information and index
+            result["file_index"] = i
+            result["processing_metadata"] = {
+                "engine_used": engine,
+                "image_enhanced": enhance_image,
+                "structured_extraction": extract_structured,
+                "processed_at": datetime.now().isoformat(),
+                "file_info": {
+                    "filename": file.filename,
+                    "size": size,
+                    "content_type": file.content_type
+                }
+            }
+            
+            results.append(result)
+            processing_stats["successful_files"] += 1
+            
+            logger.info(f"✅ File {file.filename} processing completed")
+        
+        # Keep results in upload order
+        results.sort(key=lambda r: r["file_index"])
         
         # Aggregate all extracted location information
         all_locations = []
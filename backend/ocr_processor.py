@@ -7,24 +7,34 @@ Includes intelligent text filtering, business/address classification, and confid
 import cv2
 import numpy as np
 import pytesseract
-from PIL import Image, ImageEnhance, ImageFilter
+from PIL import Image
 import re
 import json
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterable, Callable
 import logging
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from hashlib import blake2b
+from itertools import repeat
+from operator import itemgetter
+import heapq
+import importlib.util
+import multiprocessing
 import os
+import sys
+import tempfile
+import threading
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 try:
-    from skimage.restoration import denoise_bilateral
-    SKIMAGE_AVAILABLE = True
-except ImportError:
-    SKIMAGE_AVAILABLE = False
-    logger.warning("scikit-image not available, will use OpenCV alternative")
+    CUDA_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv2.error):
+    CUDA_AVAILABLE = False
 
 try:
     import jieba
@@ -33,8 +43,297 @@ except ImportError:
     JIEBA_AVAILABLE = False
     logger.warning("jieba not available, Chinese word segmentation functionality limited")
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# PaddleOCR itself is imported when the first OCRProcessor is built; this only
+# records whether it is installed
+PADDLE_INSTALLED = importlib.util.find_spec("paddleocr") is not None
+
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+    logger.warning("tesserocr not available, Tesseract will run through pytesseract subprocesses")
+
+# Line scanners for the content processors. Each one only yields lines that can
+# survive the processor's own length checks, so blank and too-short lines are
+# skipped inside the regex engine instead of the Python loop.
+UI_CANDIDATE_LINE_RE = re.compile(r"^(?=.*\S)(?P<line>.{3,80})$", re.MULTILINE)
+SOCIAL_CANDIDATE_LINE_RE = re.compile(r"^(?=.*\S)(?P<line>.{2,})$", re.MULTILINE)
+NON_BLANK_LINE_RE = re.compile(r"^(?=.*\S)(?P<line>.+)$", re.MULTILINE)
+
+# Per-line classification bits used by TravelItineraryProcessor's chunk merge
+CHUNK_STARTER = 1
+CHUNK_RELATED = 1 << 1
+CHUNK_TRAVEL = 1 << 2
+
+# SocialMediaProcessor cleanup: inline noise removed in order unless the line
+# holds a location-bearing hashtag or mention; whole-line noise is a bare
+# number or timestamp like "5h ago"
+SOCIAL_NOISE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'@\w+',  # Usernames
+    r'#\w+',  # Hashtags (but preserve for context)
+    r'\d+\s*(like|comment|share|view)s?',  # Engagement metrics
+    r'\d+[hmd]\s*ago',  # Time stamps
+    r'(sponsored|promoted|ad)',  # Ad indicators
+))
+SOCIAL_PRESERVE_PATTERNS = (
+    r'#\w*travel\w*',  # Travel hashtags
+    r'#\w*location\w*',  # Location hashtags
+    r'@\w*hotel\w*',  # Hotel mentions
+    r'@\w*restaurant\w*',  # Restaurant mentions
+)
+SOCIAL_PRESERVE_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in SOCIAL_PRESERVE_PATTERNS), re.IGNORECASE
+)
+SOCIAL_NOISE_LINE_RE = re.compile(r'\d+(?:[hmd]\s*ago)?$')
+
+# TravelItineraryProcessor chunking: lines that open a new chunk, travel
+# indicators (matched on lowercased text) and multi-word proper nouns
+TRAVEL_CHUNK_STARTER_RE = re.compile(
+    r'(?i:day)\s+\d+'  # Day indicators
+    r'|第[一二三四五六七八九十]+天'  # Chinese day indicators
+    r'|[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:National Park|Park|Trail|Lodge|Hotel)'  # Location names
+)
+TRAVEL_INDICATOR_RE = re.compile(
+    r'trail|park|lodge|hotel|center|beach|mountain|lake'  # Location indicators
+    r'|推荐|住|天'  # Chinese travel terms
+)
+PROPER_NOUN_RE = re.compile(r'[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+')
+
+# Digit/letter confusions fixed in one pass. Every fix depends on its neighbours,
+# so they share a single alternation and a lookup for the replacement character.
+OCR_DIGIT_CONFUSION_RE = re.compile(
+    r"\b0(?=[A-Za-z])"      # 0 -> O before letters
+    r"|(?<=[A-Za-z])0\b"    # 0 -> O after letters
+    r"|\b1(?=l|I)"          # 1 -> I
+    r"|5(?=S|s)"            # 5 -> S
+    r"|8(?=B|b)"            # 8 -> B
+)
+OCR_DIGIT_FIXES = {"0": "O", "1": "I", "5": "S", "8": "B"}
+
+
+def fix_ocr_digit_confusions(text: str) -> str:
+    """Apply every OCR_DIGIT_CONFUSION_RE fix in one pass"""
+    return OCR_DIGIT_CONFUSION_RE.sub(lambda match: OCR_DIGIT_FIXES[match.group()], text)
+
+
+# Text cleanup patterns, compiled once and applied in order
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Kernels for ImagePreprocessor's enhancement (PIL's SMOOTH filter and luminance weights)
+IDENTITY_KERNEL = np.array([[0, 0, 0], [0, 1, 0], [0, 0, 0]], dtype=np.float32)
+SMOOTH_KERNEL = np.array([[1, 1, 1], [1, 5, 1], [1, 1, 1]], dtype=np.float32) / 13
+BGR_LUMA_ROWS = np.tile(np.array([7471, 38470, 19595], dtype=np.float32) / 65536, (3, 1))
+
+# Content indicators for ImagePreprocessor.detect_image_type (substring matches)
+GOOGLE_MAPS_INDICATORS = (
+    'overview', 'menu', 'reviews', 'photos', 'directions',
+    'call', 'website', 'hours', 'rating', 'stars',
+    'restaurant', 'cafe', 'open', 'closed', 'min'
+)
+SOCIAL_MEDIA_INDICATORS = (
+    'like', 'comment', 'share', 'follow', 'post',
+    '@', '#', 'ago', 'minutes', 'hours', 'days',
+    'story', 'feed', 'timeline'
+)
+TRAVEL_INDICATORS = (
+    'day 1', 'day 2', 'day 3', 'itinerary', 'trip',
+    'hotel', 'lodge', 'trail', 'park', 'visitor center',
+    '推荐', '住', '第一天', '第二天', 'national park'
+)
+
+CONTENT_INDICATORS = {
+    "google_maps": GOOGLE_MAPS_INDICATORS,
+    "social_media": SOCIAL_MEDIA_INDICATORS,
+    "travel_itinerary": TRAVEL_INDICATORS,
+}
+
+
+def _build_indicator_automaton():
+    """One Aho-Corasick automaton over every content indicator, tagged with its categories"""
+    categories = {}
+    for category, indicators in CONTENT_INDICATORS.items():
+        for indicator in indicators:
+            categories.setdefault(indicator, []).append(category)
+
+    automaton = ahocorasick.Automaton()
+    for indicator, indicator_categories in categories.items():
+        automaton.add_word(indicator, (indicator, tuple(indicator_categories)))
+    automaton.make_automaton()
+    return automaton
+
+
+CONTENT_INDICATOR_AUTOMATON = _build_indicator_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+def count_content_indicators(text: str) -> Dict[str, int]:
+    """Count how many distinct indicators of each content category occur in text"""
+    if CONTENT_INDICATOR_AUTOMATON is None:
+        return {
+            category: sum(map(text.__contains__, indicators))
+            for category, indicators in CONTENT_INDICATORS.items()
+        }
+
+    # Single pass over the text; each indicator counts once however often it appears
+    counts = dict.fromkeys(CONTENT_INDICATORS, 0)
+    for indicator, categories in {value for _, value in CONTENT_INDICATOR_AUTOMATON.iter(text)}:
+        for category in categories:
+            counts[category] += 1
+    return counts
+
+# Extraction type -> (result category, minimum confidence) for HierarchicalExtractor
+HIERARCHY_CATEGORIES = {
+    "business": ("businesses", 0.6),
+    "address": ("addresses", 0.5),
+    "area": ("areas", 0.4),
+    "landmark": ("landmarks", 0.4),
+}
+CONFIDENCE_KEY = itemgetter("confidence")
+
+# Result category -> priority in the combined list (landmarks rank with areas)
+HIERARCHY_PRIORITIES = {
+    "businesses": 1,
+    "addresses": 2,
+    "areas": 3,
+    "landmarks": 3,
+    "other": 4,
+}
+
+# Phrase delimiters for HierarchicalExtractor, each mapped to a line break
+PHRASE_DELIMITER_TABLE = str.maketrans({c: "\n" for c in "|•★☆(){}[]"})
+# Punctuation fixes applied after the digit/letter confusions
+OCR_ERROR_CORRECTIONS = (
+    (re.compile(r"(?<=\w),(?=\w)"), ", "),  # Add space after comma
+    (re.compile(r"(?<=\w)\.(?=[A-Z])"), ". "),  # Add space after period
+)
+GOOGLE_MAPS_UI_RES = (
+    re.compile(r"\d\.\d\s*\(\d+\)"),  # Rating patterns like "4.3 (223)"
+    re.compile(r"\$\d+-\d+"),  # Price indicators like "$10-20"
+    re.compile(r"\d+\s+min\b"),  # Time indicators like "26 min"
+    re.compile(r"[&@#★☆]+"),  # Amp symbols and ratings
+)
+GOOGLE_MAPS_UI_BUTTON_RE = re.compile(
+    r"\b(?:order|call|save|share|directions|website)\b", re.IGNORECASE
+)
+# Matches wherever any of the Google Maps UI patterns above would
+GOOGLE_MAPS_UI_ANY_RE = re.compile(
+    "|".join(pattern.pattern for pattern in GOOGLE_MAPS_UI_RES)
+    + r"|(?i:\b(?:order|call|save|share|directions|website)\b)"
+)
+MEANINGLESS_CHARS_RE = re.compile(r"[^\w\s.,!?@#$%^&*()_+\-=\[\]{}|;:\'\"<>/\\·•★☆]")
+MID_WORD_LINE_BREAK_RE = re.compile(r"(?<=[a-z])\n(?=[a-z])")
+LINE_BREAKS_RE = re.compile(r"\n+")
+
+# IntelligentTextFilter noise checks: short tokens, symbol runs and known
+# OCR artifacts, as one anchored alternation
+OCR_NOISE_RE = re.compile("|".join(f"(?:{pattern})" for pattern in (
+    r"^[A-Z]{1,3}$",  # Single capital letters
+    r"^\d{1,2}$",     # Single/double digits
+    r"^[^\w\s]{1,3}$", # Special characters only
+    r"^(?:x|X|\+|\-|\*|\/|\=|\(|\)|\.|\,){1,5}$",  # Mathematical symbols
+    r"^(?:be|veo|suse|nery|og|ws|oe|sie|oy)$",  # Common OCR artifacts
+    r"^(?:ee|es|ae|fe|al|at|et|it|ot|ut)$",     # Two-letter artifacts
+)), re.IGNORECASE)
+SHORT_CAPITALIZED_RUN_RE = re.compile(r"^[A-Z][a-z]{1,3}(\s+[A-Z][a-z]{1,3}){2,}")
+TITLE_CASE_NAME_RE = re.compile(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2}$")
+
+# Rating, contact and hours extraction patterns
+RATING_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"(\d+\.?\d*)\s*(?:stars?|★|☆)",  # X stars, X★
+    r"(\d+\.?\d*)\s*/\s*5",  # X/5
+    r"(\d+\.?\d*)\s*/\s*10",  # X/10
+    r"Rating:\s*(\d+\.?\d*)",  # Rating: X
+))
+PHONE_PATTERNS = (
+    re.compile(r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"),  # US phone format
+    re.compile(r"\+?\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}"),  # International phone
+)
+DIGIT_RE = re.compile(r"\d")
+EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+WEBSITE_RE = re.compile(r"https?://[^\s]+|www\.[^\s]+")
+DECIMAL_RE = re.compile(r"\d+\.\d+")
+US_PHONE_RE = re.compile(r"\(\d{3}\)\s*\d{3}-\d{4}")
+HOURS_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"(?:Open|Hours?):?\s*\d{1,2}:?\d{0,2}\s*(?:AM|PM|am|pm)?\s*-\s*\d{1,2}:?\d{0,2}\s*(?:AM|PM|am|pm)?",
+    r"\d{1,2}:?\d{0,2}\s*(?:AM|PM|am|pm)\s*-\s*\d{1,2}:?\d{0,2}\s*(?:AM|PM|am|pm)",
+))
+
+# Every pattern TextProcessor's contact and rating extraction runs; one scan over
+# the text tells which of them can match at all
+TEXT_SCAN_PATTERNS = RATING_PATTERNS + PHONE_PATTERNS + (EMAIL_RE, WEBSITE_RE) + HOURS_PATTERNS
+
+
+def _build_text_scan_database():
+    """One Hyperscan database over TEXT_SCAN_PATTERNS, reporting each pattern at most once"""
+    base_flags = hyperscan.HS_FLAG_SINGLEMATCH
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.pattern.encode("utf-8") for pattern in TEXT_SCAN_PATTERNS],
+        ids=list(range(len(TEXT_SCAN_PATTERNS))),
+        flags=[
+            base_flags | (hyperscan.HS_FLAG_CASELESS if pattern.flags & re.IGNORECASE else 0)
+            for pattern in TEXT_SCAN_PATTERNS
+        ],
+    )
+    return database
+
+
+TEXT_SCAN_DATABASE = _build_text_scan_database() if HYPERSCAN_AVAILABLE else None
+# Hyperscan scratch space is not safe to share between concurrent scans
+TEXT_SCAN_LOCK = threading.Lock()
+# Hyperscan's \s is ASCII-only; Python's also covers the \x1c-\x1f separators
+TEXT_SCAN_SEPARATORS = str.maketrans(dict.fromkeys(range(0x1C, 0x20), " "))
+
+
+@lru_cache(maxsize=64)
+def matching_text_patterns(text: str) -> Optional[frozenset]:
+    """Patterns from TEXT_SCAN_PATTERNS that match somewhere in text.
+
+    Returns None when Hyperscan is unavailable or the text is not ASCII, where
+    its character classes would disagree with Python's Unicode ones.
+    """
+    if TEXT_SCAN_DATABASE is None or not text.isascii():
+        return None
+
+    matched = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        matched.add(TEXT_SCAN_PATTERNS[pattern_id])
+
+    with TEXT_SCAN_LOCK:
+        TEXT_SCAN_DATABASE.scan(
+            text.translate(TEXT_SCAN_SEPARATORS).encode("ascii"), match_event_handler=on_match
+        )
+    return frozenset(matched)
+
+# Script counts for TesseractOCR.language_from_probe_text
+CJK_CHAR_RE = re.compile(r"[\u4e00-\u9fff]")
+LATIN_CHAR_RE = re.compile(r"[a-zA-Z]")
+
+# Threads used by OCRProcessor.process_images to preprocess a batch
+PREPROCESS_THREADS = 4
 
-@dataclass
+# OCR engine outputs an OCRProcessor keeps, keyed by image content and engine,
+# so identical images only redo the text post-processing
+OCR_CACHE_SIZE = 128
+
+# Slotted result objects (no per-instance __dict__) where the interpreter supports it
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class OCRResult:
     """OCR result data structure"""
     text: str
@@ -43,27 +342,17 @@ class OCRResult:
     language: str = "en"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProcessedOCRResult:
     """Processed OCR result"""
     raw_text: str
     cleaned_text: str
     structured_data: Dict
     confidence: float
-    detected_locations: List[str] = None
-    detected_addresses: List[str] = None
-    detected_names: List[str] = None
-    locations: List[str] = None  # Add this for backward compatibility
-
-    def __post_init__(self):
-        if self.detected_locations is None:
-            self.detected_locations = []
-        if self.detected_addresses is None:
-            self.detected_addresses = []
-        if self.detected_names is None:
-            self.detected_names = []
-        if self.locations is None:
-            self.locations = []
+    detected_locations: List[str] = field(default_factory=list)
+    detected_addresses: List[str] = field(default_factory=list)
+    detected_names: List[str] = field(default_factory=list)
+    locations: List[str] = field(default_factory=list)  # Add this for backward compatibility
 
 
 class GroundTruthPatternLearner:
@@ -106,62 +395,89 @@ class GroundTruthPatternLearner:
             "1313 Ninth St": [r"1313\s+Ninth\s+St"],
             "1601 San Pablo Ave": [r"1601\s+San\s+Pablo\s+Ave"]
         }
+        
+        # Flatten the tables once so lookups don't walk the nested dicts per call
+        self.business_patterns = [
+            (pattern, "known_business", 0.95)
+            for data in self.known_businesses.values()
+            for pattern in data["patterns"]
+        ]
+        self.address_patterns = [
+            (pattern, "known_address", 0.9)
+            for pattern_list in self.known_addresses.values()
+            for pattern in pattern_list
+        ]
+    
+    @cached_property
+    def compiled_business_patterns(self):
+        """Compiled (regex, owner, business type) entries in match priority order"""
+        return [
+            (re.compile(pattern, re.IGNORECASE), business, data["type"])
+            for business, data in self.known_businesses.items()
+            for pattern in data["patterns"]
+        ]
+    
+    @cached_property
+    def compiled_address_patterns(self):
+        """Compiled (regex, address) entries in match priority order"""
+        return [
+            (re.compile(pattern, re.IGNORECASE), address)
+            for address, pattern_list in self.known_addresses.items()
+            for pattern in pattern_list
+        ]
     
     def get_business_patterns(self):
         """Get all business name patterns"""
-        patterns = []
-        for business, data in self.known_businesses.items():
-            for pattern in data["patterns"]:
-                patterns.append((pattern, "known_business", 0.95))
-        return patterns
+        return self.business_patterns
     
     def get_address_patterns(self):
         """Get all address patterns"""
-        patterns = []
-        for address, pattern_list in self.known_addresses.items():
-            for pattern in pattern_list:
-                patterns.append((pattern, "known_address", 0.9))
-        return patterns
+        return self.address_patterns
 
 
 class ContentAwareProcessor:
     """Process different content types with specialized strategies"""
     
-    def __init__(self):
-        self.google_maps_processor = GoogleMapsProcessor()
-        self.social_media_processor = SocialMediaProcessor()
-        self.travel_processor = TravelItineraryProcessor()
+    # Sub-processor attribute per image type; anything else uses Google Maps processing
+    processor_attributes = {
+        "google_maps": "google_maps_processor",
+        "social_media": "social_media_processor",
+        "travel_itinerary": "travel_processor",
+    }
+    
+    # Sub-processors are built on first use, so a run that only sees one
+    # content type never pays for the others
+    @cached_property
+    def google_maps_processor(self):
+        return GoogleMapsProcessor()
+    
+    @cached_property
+    def social_media_processor(self):
+        return SocialMediaProcessor()
+    
+    @cached_property
+    def travel_processor(self):
+        return TravelItineraryProcessor()
     
     def process_by_type(self, text: str, image_type: str) -> Dict:
         """Process text based on detected image type"""
-        if image_type == "google_maps":
-            return self.google_maps_processor.process(text)
-        elif image_type == "social_media":
-            return self.social_media_processor.process(text)
-        elif image_type == "travel_itinerary":
-            return self.travel_processor.process(text)
-        else:
-            # Default to mixed content processing
-            return self.google_maps_processor.process(text)
+        # Default to mixed content processing
+        attribute = self.processor_attributes.get(image_type, "google_maps_processor")
+        return getattr(self, attribute).process(text)
 
 
 class GoogleMapsProcessor:
     """Specialized processor for Google Maps screenshots"""
     
+    def __init__(self):
+        self.filter_tool = IntelligentTextFilter()
+    
     def process(self, text: str) -> Dict:
         """Process Google Maps content"""
-        filter_tool = IntelligentTextFilter()
-        
         # Use existing Google Maps processing logic
-        lines = text.split('\n')
-        filtered_lines = []
-        
-        for line in lines:
-            if not filter_tool.is_ui_element(line):
-                cleaned = filter_tool.filter_google_maps_ui(line)
-                cleaned = filter_tool.clean_ocr_artifacts(cleaned)
-                if cleaned and len(cleaned.strip()) >= 3:
-                    filtered_lines.append(cleaned.strip())
+        filtered_lines = self.filter_tool.filter_lines(
+            match.group("line") for match in UI_CANDIDATE_LINE_RE.finditer(text)
+        )
         
         return {
             "content_type": "google_maps",
@@ -174,29 +490,26 @@ class SocialMediaProcessor:
     """Specialized processor for social media screenshots"""
     
     def __init__(self):
-        # Social media specific noise patterns
-        self.social_noise_patterns = [
-            r'@\w+',  # Usernames
-            r'#\w+',  # Hashtags (but preserve for context)
-            r'\d+\s*(like|comment|share|view)s?',  # Engagement metrics
-            r'\d+[hmd]\s*ago',  # Time stamps
-            r'(sponsored|promoted|ad)',  # Ad indicators
-        ]
-        
-        # Preserve these patterns as they might contain location info
-        self.preserve_patterns = [
-            r'#\w*travel\w*',  # Travel hashtags
-            r'#\w*location\w*',  # Location hashtags
-            r'@\w*hotel\w*',  # Hotel mentions
-            r'@\w*restaurant\w*',  # Restaurant mentions
-        ]
+        # Social media specific noise patterns, and the ones to preserve as
+        # they might contain location info (compiled once at module level)
+        self.social_noise_patterns = [regex.pattern for regex in SOCIAL_NOISE_RES]
+        self.preserve_patterns = list(SOCIAL_PRESERVE_PATTERNS)
+        
+        # Re-processed screenshots give the same OCR text, so results are
+        # cached per processor
+        self._process_cached = lru_cache(maxsize=256)(self._process_text)
     
     def process(self, text: str) -> Dict:
         """Process social media content with minimal filtering"""
-        lines = text.split('\n')
+        # Callers may update the returned dict, so hand out a copy of the cached one
+        return dict(self._process_cached(text))
+    
+    def _process_text(self, text: str) -> Dict:
+        """Uncached processing behind process"""
         processed_lines = []
         
-        for line in lines:
+        for match in SOCIAL_CANDIDATE_LINE_RE.finditer(text):
+            line = match.group("line")
             # Skip obvious noise but preserve content
             if self._is_social_noise(line):
                 continue
@@ -216,26 +529,19 @@ class SocialMediaProcessor:
         """Check if text is social media noise"""
         text_lower = text.lower().strip()
         
-        # Skip very short engagement metrics
-        if re.match(r'^\d+$', text_lower):  # Just numbers
-            return True
-            
-        # Skip pure timestamp lines
-        if re.match(r'^\d+[hmd]\s*ago$', text_lower):
-            return True
-            
-        return False
+        # Skip very short engagement metrics and pure timestamp lines
+        return SOCIAL_NOISE_LINE_RE.match(text_lower) is not None
     
     def _clean_social_content(self, text: str) -> str:
         """Clean social media content while preserving context"""
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         
         # Remove some noise but keep location-relevant content
-        for pattern in self.social_noise_patterns:
+        for regex in SOCIAL_NOISE_RES:
             # Check if it's a pattern we want to preserve
-            if not any(re.search(preserve, text, re.IGNORECASE) for preserve in self.preserve_patterns):
-                text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+            if not SOCIAL_PRESERVE_RE.search(text):
+                text = regex.sub('', text)
         
         return text.strip()
 
@@ -259,9 +565,24 @@ class TravelItineraryProcessor:
             r'推荐[^，。]*',  # Chinese recommendations
             r'[A-Z][^.]*(?:trail|park|lodge|hotel|center)[^.]*',  # Location descriptions
         ]
+        
+        # Keyword check on lowercased text, as one alternation; the other line
+        # checks share the module-level TRAVEL_* patterns
+        self.travel_keyword_re = re.compile('|'.join(map(re.escape, self.travel_keywords)))
+        
+        # Re-processed screenshots give the same OCR text, so results are
+        # cached per processor
+        self._process_cached = lru_cache(maxsize=256)(self._process_text)
     
     def process(self, text: str) -> Dict:
         """Process travel itinerary with semantic chunking"""
+        # Callers may update the returned dict or its chunk list, so copy both
+        result = dict(self._process_cached(text))
+        result["chunks"] = list(result["chunks"])
+        return result
+    
+    def _process_text(self, text: str) -> Dict:
+        """Uncached processing behind process"""
         # Extract semantic chunks instead of individual words
         chunks = self._extract_semantic_chunks(text)
         
@@ -276,29 +597,30 @@ class TravelItineraryProcessor:
         """Extract meaningful chunks from travel content"""
         chunks = []
         
-        # Split by lines and process each
-        lines = text.split('\n')
+        # Classify every non-blank line once, then merge chunks from the flags
+        lines = []
+        flags = []
+        for match in NON_BLANK_LINE_RE.finditer(text):
+            line = match.group("line").strip()
+            lines.append(line)
+            flags.append(self._line_flags(line))
+        
         current_chunk = ""
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
+        for line, line_flags in zip(lines, flags):
             # Check if this line starts a new semantic chunk
-            if self._is_chunk_starter(line):
+            if line_flags & CHUNK_STARTER:
+                if current_chunk:
+                    chunks.append(current_chunk.strip())
+                current_chunk = line
+            # Add to current chunk if it's related
+            elif current_chunk and line_flags & CHUNK_RELATED:
+                current_chunk += " " + line
+            elif line_flags & CHUNK_TRAVEL:
+                # Start new chunk if it has travel content
                 if current_chunk:
                     chunks.append(current_chunk.strip())
                 current_chunk = line
-            else:
-                # Add to current chunk if it's related
-                if current_chunk and self._is_related_content(line):
-                    current_chunk += " " + line
-                elif self._has_travel_content(line):
-                    # Start new chunk if it has travel content
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                    current_chunk = line
         
         # Add final chunk
         if current_chunk:
@@ -312,50 +634,27 @@ class TravelItineraryProcessor:
         
         return relevant_chunks
     
-    def _is_chunk_starter(self, text: str) -> bool:
-        """Check if text starts a new semantic chunk"""
-        text_lower = text.lower()
-        
-        # Day indicators
-        if re.match(r'day\s+\d+', text_lower):
-            return True
-            
-        # Chinese day indicators
-        if re.match(r'第[一二三四五六七八九十]+天', text):
-            return True
-            
-        # Location names (capitalized words)
-        if re.match(r'[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:National Park|Park|Trail|Lodge|Hotel)', text):
-            return True
-            
-        return False
-    
-    def _is_related_content(self, text: str) -> bool:
-        """Check if text is related to current chunk"""
-        text_lower = text.lower()
-        
-        # Contains travel keywords
-        return any(keyword in text_lower for keyword in self.travel_keywords)
+    def _line_flags(self, line: str) -> int:
+        """Pack the chunk starter / related / travel checks for a line into bit flags"""
+        line_flags = 0
+        # Opens a new semantic chunk
+        if TRAVEL_CHUNK_STARTER_RE.match(line):
+            line_flags |= CHUNK_STARTER
+        # Related to the current chunk: contains travel keywords
+        if self.travel_keyword_re.search(line.lower()):
+            line_flags |= CHUNK_RELATED
+        if self._has_travel_content(line):
+            line_flags |= CHUNK_TRAVEL
+        return line_flags
     
     def _has_travel_content(self, text: str) -> bool:
         """Check if text contains travel-related content"""
-        text_lower = text.lower()
-        
-        # Has location indicators
-        location_indicators = ['trail', 'park', 'lodge', 'hotel', 'center', 'beach', 'mountain', 'lake']
-        if any(indicator in text_lower for indicator in location_indicators):
-            return True
-            
-        # Has Chinese travel terms
-        chinese_terms = ['推荐', '住', '天']
-        if any(term in text for term in chinese_terms):
+        # Has location indicators or Chinese travel terms
+        if TRAVEL_INDICATOR_RE.search(text.lower()):
             return True
             
         # Has proper nouns (likely place names)
-        if re.search(r'[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+', text):
-            return True
-            
-        return False
+        return PROPER_NOUN_RE.search(text) is not None
     
     def _is_relevant_chunk(self, chunk: str) -> bool:
         """Check if chunk is relevant for extraction"""
@@ -401,23 +700,27 @@ class IntelligentTextFilter:
             "visit", "try", "taste", "enjoy", "experience", "discover"
         }
         
-        # OCR noise patterns to remove
-        self.noise_patterns = [
-            r"^[A-Z]{1,3}$",  # Single capital letters
-            r"^\d{1,2}$",     # Single/double digits
-            r"^[^\w\s]{1,3}$", # Special characters only
-            r"^(?:x|X|\+|\-|\*|\/|\=|\(|\)|\.|\,){1,5}$",  # Mathematical symbols
-            r"^(?:be|veo|suse|nery|og|ws|oe|sie|oy)$",  # Common OCR artifacts
-            r"^(?:ee|es|ae|fe|al|at|et|it|ot|ut)$",     # Two-letter artifacts
-        ]
+        # Every substring of a blacklist entry, so "text is part of a UI element"
+        # becomes one set lookup (this keeps truncated OCR like "overvie" filtered)
+        self.ui_blacklist_fragments = frozenset(
+            ui_element[start:end]
+            for ui_element in self.ui_blacklist
+            for start in range(len(ui_element) + 1)
+            for end in range(start, len(ui_element) + 1)
+        )
+        
+        # One alternation for "text contains a UI element"
+        self.ui_blacklist_re = re.compile(
+            "|".join(re.escape(ui_element) for ui_element in sorted(self.ui_blacklist, key=len, reverse=True))
+        )
         
         # Common OCR garbage words that appear in Google Maps screenshots
-        self.ocr_garbage_words = {
+        self.ocr_garbage_words = frozenset({
             "be", "veo", "suse", "nery", "og", "ws", "oe", "sie", "oy", "ee", "es", "ae", "fe", 
             "al", "at", "et", "it", "ot", "ut", "dad", "ess", "hare", "nic", "sa", "tint", "au",
             "mep", "op", "eee", "ye", "ole", "als", "lial", "mre", "wi", "gle", "beet", "fwa",
             "dat", "peele", "bens", "ghee", "ney", "fes", "aye", "ke", "aw", "pay", "ses", "vv"
-        }
+        })
         
         # Minimum meaningful text length
         self.min_text_length = 3
@@ -430,31 +733,32 @@ class IntelligentTextFilter:
         # Business type classification
         if any(indicator in text_lower for indicator in ['restaurant', 'cafe', 'coffee', 'bakery', 'grill', 'kitchen']):
             return 'business'
-        elif any(indicator in text_lower for indicator in ['street', 'avenue', 'road', 'boulevard', 'drive', 'place']) and re.search(r'\d+', text):
+        elif any(indicator in text_lower for indicator in ['street', 'avenue', 'road', 'boulevard', 'drive', 'place']) and DIGIT_RE.search(text):
             return 'address'
         elif any(indicator in text_lower for indicator in ['plaza', 'center', 'mall', 'square']):
             return 'landmark'
-        elif re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2}$', text) and len(text) > 6:
+        elif TITLE_CASE_NAME_RE.match(text) and len(text) > 6:
             return 'business'
         else:
             return 'location'
 
     def is_ui_element(self, text: str) -> bool:
         """Check if text is a UI element"""
+        # Cheapest checks first: length, then symbol-only text
+        if len(text) < self.min_text_length or len(text) > self.max_text_length:
+            return True
+        
+        if not any(c.isalnum() for c in text):
+            return True
+        
         text_lower = text.lower().strip()
         
         # Check against UI blacklist
-        for ui_element in self.ui_blacklist:
-            if ui_element in text_lower or text_lower in ui_element:
-                return True
+        if text_lower in self.ui_blacklist_fragments or self.ui_blacklist_re.search(text_lower):
+            return True
         
         # Check for noise patterns
-        for pattern in self.noise_patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                return True
-        
-        # Length check
-        if len(text) < self.min_text_length or len(text) > self.max_text_length:
+        if OCR_NOISE_RE.match(text):
             return True
         
         # Check for OCR garbage
@@ -470,7 +774,8 @@ class IntelligentTextFilter:
         
         # If text is mostly garbage words, it's probably OCR noise
         if len(words) >= 2:
-            garbage_word_count = sum(1 for word in words if word in self.ocr_garbage_words)
+            # map() keeps the membership loop in C; repeated words still count
+            garbage_word_count = sum(map(self.ocr_garbage_words.__contains__, words))
             garbage_ratio = garbage_word_count / len(words)
             
             # If more than 60% of words are garbage, classify as noise
@@ -485,48 +790,46 @@ class IntelligentTextFilter:
                 return True
         
         # Check for random character sequences
-        if re.match(r'^[A-Z][a-z]{1,3}(\s+[A-Z][a-z]{1,3}){2,}', text):
+        if SHORT_CAPITALIZED_RUN_RE.match(text):
             # Pattern like "Be Veo Suse Nery" - multiple short capitalized words
             return True
         
         return False
     
+    def filter_lines(self, lines: Iterable[str]) -> List[str]:
+        """Drop UI elements and noise, returning the cleaned lines that remain"""
+        # Bind the per-line helpers once; this loop runs for every OCR line
+        is_ui_element = self.is_ui_element
+        filter_google_maps_ui = self.filter_google_maps_ui
+        clean_ocr_artifacts = self.clean_ocr_artifacts
+        has_ui_text = GOOGLE_MAPS_UI_ANY_RE.search
+        
+        filtered = []
+        for line in lines:
+            if not is_ui_element(line):
+                # One combined scan decides whether the five UI removals can change anything
+                line = filter_google_maps_ui(line) if has_ui_text(line) else line.strip()
+                cleaned = clean_ocr_artifacts(line).strip()
+                if len(cleaned) >= 3:
+                    filtered.append(cleaned)
+        
+        return filtered
+    
     def filter_google_maps_ui(self, text: str) -> str:
         """Remove Google Maps specific UI elements"""
-        # Remove rating patterns like "4.3 (223)"
-        text = re.sub(r"\d\.\d\s*\(\d+\)", "", text)
-        
-        # Remove price indicators like "$10-20"
-        text = re.sub(r"\$\d+-\d+", "", text)
-        
-        # Remove time indicators like "26 min"
-        text = re.sub(r"\d+\s+min\b", "", text)
-        
-        # Remove amp symbols and ratings
-        text = re.sub(r"[&@#★☆]+", "", text)
+        # Remove ratings, prices, travel times and symbols
+        for pattern in GOOGLE_MAPS_UI_RES:
+            text = pattern.sub("", text)
         
         # Remove common UI button text
-        ui_buttons = ["order", "call", "save", "share", "directions", "website"]
-        for button in ui_buttons:
-            text = re.sub(rf"\b{button}\b", "", text, flags=re.IGNORECASE)
+        text = GOOGLE_MAPS_UI_BUTTON_RE.sub("", text)
         
         return text.strip()
     
     def clean_ocr_artifacts(self, text: str) -> str:
         """Clean common OCR recognition artifacts"""
         # Fix common character misrecognitions
-        replacements = {
-            r"\b0(?=[A-Za-z])": "O",  # 0 -> O before letters
-            r"(?<=[A-Za-z])0\b": "O",  # 0 -> O after letters
-            r"\b1(?=l|I)": "I",       # 1 -> I
-            r"5(?=S|s)": "S",         # 5 -> S
-            r"8(?=B|b)": "B",         # 8 -> B
-        }
-        
-        for pattern, replacement in replacements.items():
-            text = re.sub(pattern, replacement, text)
-        
-        return text
+        return fix_ocr_digit_confusions(text)
 
 
 class LocationClassifier:
@@ -575,93 +878,23 @@ class LocationClassifier:
             r"(?:tokyo|kyoto|osaka|sapporo|hiroshima)\s*[A-Za-z]*",
             r"[A-Za-z]+\s*(?:station|temple|shrine|castle|tower)"
         ]
-    
-    def classify_text(self, text: str, ocr_confidence: float) -> Dict[str, any]:
-        """Classify text and return detailed classification info"""
-        text_lower = text.lower().strip()
-        
-        # Check against known businesses first (highest priority)
-        for business_name, data in self.gt_learner.known_businesses.items():
-            for pattern in data["patterns"]:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    # Extract just the matched business name, not the entire phrase
-                    matched_text = match.group().strip()
-                    return {
-                        "text": matched_text,  # Return clean matched text, not entire phrase
-                        "type": "business",
-                        "subtype": "known_business",
-                        "confidence": min(0.95, ocr_confidence * 1.3),
-                        "matched_business": business_name,
-                        "business_type": data["type"]
-                    }
-        
-        # Check against known addresses
-        for address, patterns in self.gt_learner.known_addresses.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return {
-                        "text": text,
-                        "type": "address",
-                        "subtype": "known_address",
-                        "confidence": min(0.9, ocr_confidence * 1.2),
-                        "matched_address": address
-                    }
         
-        # Check for address patterns
-        address_patterns = [
+        # Street address patterns
+        self.address_patterns = [
             r"\d{2,5}\s+\w+.*(?:street|st|avenue|ave|road|rd|boulevard|blvd|drive|dr|place|pl|plaza)",
             r"\d{2,5}\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3}\s+(?:St|Ave|Rd|Blvd|Dr|Pl|Plaza)"
         ]
         
-        for pattern in address_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return {
-                    "text": text,
-                    "type": "address",
-                    "subtype": "street_address",
-                    "confidence": min(0.8, ocr_confidence * 1.1)
-                }
-        
-        # Check for Japanese business patterns
-        for pattern in self.japanese_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return {
-                    "text": text,
-                    "type": "business",
-                    "subtype": "japanese_business",
-                    "confidence": min(0.8, ocr_confidence * 1.1)
-                }
-        
-        # Check for landmark/travel patterns
-        for landmark in self.landmark_indicators:
-            if landmark in text_lower:
-                return {
-                    "text": text,
-                    "type": "landmark",
-                    "subtype": "travel_landmark",
-                    "confidence": min(0.8, ocr_confidence * 1.1)
-                }
-        
         # Enhanced business name patterns
-        business_patterns = [
+        self.business_patterns = [
             rf"[A-Z][a-zA-Z\s\'&\-]{{3,25}}\s+(?:{'|'.join(self.business_indicators)})",
             r"[A-Z][a-zA-Z\s\'&\-]{3,30}(?:\s+(?:berkeley|oakland|sf|san francisco))?",
             r"(?:Katsumidori|Marugame|FLAIR|BABAL)\s*(?:sushi|udon|bar)?",  # Specific missed businesses
             r"[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Sacred Heart School|School)",  # Schools
         ]
         
-        for pattern in business_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return {
-                    "text": text,
-                    "type": "business",
-                    "subtype": "potential_business",
-                    "confidence": min(0.7, ocr_confidence * 1.0)
-                }
-        
         # Enhanced area/location patterns
-        area_patterns = [
+        self.area_patterns = [
             r"(?:Sapporo|Tokyo|Kyoto|Osaka)\s*(?:Area|District|Prefecture)?",
             r"Olympic\s+National\s+Park",
             r"Quinault\s+(?:rain\s+forest|Lake)",
@@ -671,25 +904,133 @@ class LocationClassifier:
             r"Jackson(?:\s+Hole)?",
         ]
         
-        for pattern in area_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        # Each pattern group only decides whether a rule applies, so it is
+        # compiled once as a single alternation
+        self.address_pattern_re = self._compile_any(self.address_patterns)
+        self.japanese_pattern_re = self._compile_any(self.japanese_patterns)
+        self.business_pattern_re = self._compile_any(self.business_patterns)
+        self.area_pattern_re = self._compile_any(self.area_patterns)
+        
+        # Landmark and area names are plain substrings, checked in one pass each
+        self.landmark_automaton = self._build_automaton(self.landmark_indicators)
+        self.area_automaton = self._build_automaton(self.area_indicators)
+        
+        # Screenshots repeat the same names and labels, so classifications are
+        # cached per classifier (the result depends on this learner's patterns)
+        self._classify_cached = lru_cache(maxsize=4096)(self._classify_text)
+    
+    def classify_text(self, text: str, ocr_confidence: float) -> Dict[str, any]:
+        """Classify text and return detailed classification info"""
+        # Callers update the returned dict, so hand out a copy of the cached one
+        return dict(self._classify_cached(text, ocr_confidence))
+    
+    @staticmethod
+    def _compile_any(patterns: List[str]) -> re.Pattern:
+        """One case-insensitive regex that matches wherever any of the patterns does"""
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+    
+    @staticmethod
+    def _build_automaton(words: List[str]):
+        """Aho-Corasick automaton over plain keywords, or None without pyahocorasick"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _contains_any(automaton, words: List[str], text: str) -> bool:
+        """Whether any keyword occurs in text (the automaton stops at the first hit)"""
+        if automaton is None:
+            return any(word in text for word in words)
+        return next(automaton.iter(text), None) is not None
+    
+    def _classify_text(self, text: str, ocr_confidence: float) -> Dict[str, any]:
+        """Uncached classification logic behind classify_text"""
+        text_lower = text.lower().strip()
+        
+        # Check against known businesses first (highest priority)
+        for pattern, business_name, business_type in self.gt_learner.compiled_business_patterns:
+            match = pattern.search(text)
+            if match:
+                # Extract just the matched business name, not the entire phrase
+                matched_text = match.group().strip()
                 return {
-                    "text": text,
-                    "type": "area",
-                    "subtype": "named_location",
-                    "confidence": min(0.8, ocr_confidence * 1.1)
+                    "text": matched_text,  # Return clean matched text, not entire phrase
+                    "type": "business",
+                    "subtype": "known_business",
+                    "confidence": min(0.95, ocr_confidence * 1.3),
+                    "matched_business": business_name,
+                    "business_type": business_type
                 }
         
-        # Check for area/location names (fallback)
-        for area in self.area_indicators:
-            if area in text_lower:
+        # Check against known addresses
+        for pattern, address in self.gt_learner.compiled_address_patterns:
+            if pattern.search(text):
                 return {
                     "text": text,
-                    "type": "area",
-                    "subtype": "geographic_area",
-                    "confidence": min(0.6, ocr_confidence * 0.9)
+                    "type": "address",
+                    "subtype": "known_address",
+                    "confidence": min(0.9, ocr_confidence * 1.2),
+                    "matched_address": address
                 }
         
+        # Check for address patterns
+        if self.address_pattern_re.search(text):
+            return {
+                "text": text,
+                "type": "address",
+                "subtype": "street_address",
+                "confidence": min(0.8, ocr_confidence * 1.1)
+            }
+        
+        # Check for Japanese business patterns
+        if self.japanese_pattern_re.search(text):
+            return {
+                "text": text,
+                "type": "business",
+                "subtype": "japanese_business",
+                "confidence": min(0.8, ocr_confidence * 1.1)
+            }
+        
+        # Check for landmark/travel patterns
+        if self._contains_any(self.landmark_automaton, self.landmark_indicators, text_lower):
+            return {
+                "text": text,
+                "type": "landmark",
+                "subtype": "travel_landmark",
+                "confidence": min(0.8, ocr_confidence * 1.1)
+            }
+        
+        # Enhanced business name patterns
+        if self.business_pattern_re.search(text):
+            return {
+                "text": text,
+                "type": "business",
+                "subtype": "potential_business",
+                "confidence": min(0.7, ocr_confidence * 1.0)
+            }
+        
+        # Enhanced area/location patterns
+        if self.area_pattern_re.search(text):
+            return {
+                "text": text,
+                "type": "area",
+                "subtype": "named_location",
+                "confidence": min(0.8, ocr_confidence * 1.1)
+            }
+        
+        # Check for area/location names (fallback)
+        if self._contains_any(self.area_automaton, self.area_indicators, text_lower):
+            return {
+                "text": text,
+                "type": "area",
+                "subtype": "geographic_area",
+                "confidence": min(0.6, ocr_confidence * 0.9)
+            }
+        
         # Default classification for unmatched text
         return {
             "text": text,
@@ -705,32 +1046,32 @@ class ConfidenceRefiner:
     def __init__(self):
         self.length_optimal_range = (5, 35)  # Optimal text length range
         self.context_boost_words = ["restaurant", "cafe", "street", "avenue", "plaza"]
-        
-    def refine_confidence(self, classification: Dict[str, any], context: Dict[str, any] = None) -> float:
-        """Refine confidence score based on multiple factors"""
-        base_confidence = classification["confidence"]
-        text = classification["text"]
-        text_type = classification["type"]
-        
-        # Start with base confidence
-        refined_confidence = base_confidence
+        self.context_boost_re = re.compile("|".join(self.context_boost_words))
         
         # Type-based adjustments
-        type_multipliers = {
+        self.type_multipliers = {
             "business": 1.2,
             "address": 1.1,
             "area": 1.0,
             "other": 0.6
         }
+        self.subtype_multipliers = {
+            "known_business": 1.3,
+            "known_address": 1.2
+        }
         
-        if text_type in type_multipliers:
-            refined_confidence *= type_multipliers[text_type]
+        # All-caps fragments are usually OCR noise unless they carry a place word
+        self.caps_noise_re = re.compile(r"^[A-Z\s]{2,10}$")
+        self.caps_noise_exceptions = ["el", "san", "st"]
         
-        # Subtype adjustments
-        if classification.get("subtype") == "known_business":
-            refined_confidence *= 1.3
-        elif classification.get("subtype") == "known_address":
-            refined_confidence *= 1.2
+    def refine_confidence(self, classification: Dict[str, any], context: Dict[str, any] = None) -> float:
+        """Refine confidence score based on multiple factors"""
+        text = classification["text"]
+        
+        # Start with base confidence, then type and subtype adjustments
+        refined_confidence = classification["confidence"]
+        refined_confidence *= self.type_multipliers.get(classification["type"], 1.0)
+        refined_confidence *= self.subtype_multipliers.get(classification.get("subtype"), 1.0)
         
         # Length factor
         text_length = len(text)
@@ -743,17 +1084,15 @@ class ConfidenceRefiner:
         
         # Context boost for business-related words
         text_lower = text.lower()
-        for boost_word in self.context_boost_words:
-            if boost_word in text_lower:
-                refined_confidence *= 1.1
-                break
+        if self.context_boost_re.search(text_lower):
+            refined_confidence *= 1.1
         
         # Penalize if text looks like OCR noise
-        if re.match(r"^[A-Z\s]{2,10}$", text) and not any(word in text.lower() for word in ["el", "san", "st"]):
+        if self.caps_noise_re.match(text) and not any(word in text_lower for word in self.caps_noise_exceptions):
             refined_confidence *= 0.4
         
         # Ensure confidence stays within bounds
-        return max(0.0, min(1.0, refined_confidence))
+        return 0.0 if refined_confidence < 0.0 else (1.0 if refined_confidence > 1.0 else refined_confidence)
 
 
 class HierarchicalExtractor:
@@ -768,6 +1107,16 @@ class HierarchicalExtractor:
     def extract_hierarchical(self, text: str, ocr_confidence: float) -> Dict[str, List[Dict]]:
         """Extract locations in hierarchical order"""
         
+        hierarchical_results = {
+            "businesses": [],
+            "addresses": [], 
+            "areas": [],
+            "landmarks": [],
+            "other": []
+        }
+        if not text:
+            return hierarchical_results
+        
         classified_extractions = []
         
         # First, run pattern matching on the full text for known businesses and addresses
@@ -781,17 +1130,19 @@ class HierarchicalExtractor:
         # Then, split text into potential location phrases for other extractions
         phrases = self._split_into_phrases(text)
         
-        # Filter out UI elements and noise
-        filtered_phrases = []
-        for phrase in phrases:
-            if not self.filter.is_ui_element(phrase):
-                cleaned = self.filter.filter_google_maps_ui(phrase)
-                cleaned = self.filter.clean_ocr_artifacts(cleaned)
-                if cleaned and len(cleaned.strip()) >= 3:
-                    filtered_phrases.append(cleaned.strip())
+        # Filter out UI elements and noise; identical phrases only need classifying once
+        filtered_phrases = dict.fromkeys(self.filter.filter_lines(phrases))
+        
+        # Phrases that are just part of a known business/address found above add nothing
+        known_text = " ".join(
+            extraction.get("matched_address", extraction["text"]).lower()
+            for extraction in classified_extractions
+        )
         
         # Classify and score each phrase (skip if we already found a known business/address)
         for phrase in filtered_phrases:
+            if known_text and phrase.lower() in known_text:
+                continue
             classification = self.classifier.classify_text(phrase, ocr_confidence)
             # Skip if we already have a known business/address from full text
             if classification.get("subtype") in ["known_business", "known_address"]:
@@ -800,76 +1151,27 @@ class HierarchicalExtractor:
             classification["confidence"] = refined_confidence
             classified_extractions.append(classification)
         
-        # Group by type and sort by confidence
-        hierarchical_results = {
-            "businesses": [],
-            "addresses": [], 
-            "areas": [],
-            "landmarks": [],
-            "other": []
-        }
-        
+        # Group by type, dropping anything below its category's confidence threshold
         for extraction in classified_extractions:
-            extraction_type = extraction["type"]
-            if extraction_type == "business":
-                hierarchical_results["businesses"].append(extraction)
-            elif extraction_type == "address":
-                hierarchical_results["addresses"].append(extraction)
-            elif extraction_type == "area":
-                hierarchical_results["areas"].append(extraction)
-            elif extraction_type == "landmark":
-                hierarchical_results["landmarks"].append(extraction)
-            else:
-                hierarchical_results["other"].append(extraction)
-        
-        # Sort each category by confidence and limit results
-        for category in hierarchical_results:
-            hierarchical_results[category] = sorted(
-                hierarchical_results[category], 
-                key=lambda x: x["confidence"], 
-                reverse=True
-            )[:10]  # Limit to top 10 per category
-        
-        # Filter by minimum confidence thresholds
-        confidence_thresholds = {
-            "businesses": 0.6,
-            "addresses": 0.5,
-            "areas": 0.4,
-            "landmarks": 0.4,
-            "other": 0.3
-        }
+            category, threshold = HIERARCHY_CATEGORIES.get(extraction["type"], ("other", 0.3))
+            if extraction["confidence"] >= threshold:
+                hierarchical_results[category].append(extraction)
         
-        for category, threshold in confidence_thresholds.items():
-            hierarchical_results[category] = [
-                item for item in hierarchical_results[category] 
-                if item["confidence"] >= threshold
-            ]
+        # Keep the top 10 per category by confidence
+        for category, extractions in hierarchical_results.items():
+            hierarchical_results[category] = heapq.nlargest(10, extractions, key=CONFIDENCE_KEY)
         
         return hierarchical_results
     
     def _split_into_phrases(self, text: str) -> List[str]:
         """Split text into meaningful phrases for analysis"""
-        # Split by common delimiters
-        delimiters = ['\n', '|', '•', '★', '☆', '()', '{}', '[]']
-        
-        phrases = [text]
-        for delimiter in delimiters:
-            new_phrases = []
-            for phrase in phrases:
-                new_phrases.extend(phrase.split(delimiter))
-            phrases = new_phrases
-        
-        # Clean and filter phrases
-        cleaned_phrases = []
-        for phrase in phrases:
-            # Remove extra whitespace
-            cleaned = re.sub(r'\s+', ' ', phrase.strip())
-            
-            # Skip very short or very long phrases
-            if 3 <= len(cleaned) <= 80:
-                cleaned_phrases.append(cleaned)
-        
-        return cleaned_phrases
+        # Split by common delimiters in one pass, then clean and keep
+        # phrases of a reasonable length
+        cleaned_phrases = [
+            WHITESPACE_RE.sub(' ', phrase.strip())
+            for phrase in text.translate(PHRASE_DELIMITER_TABLE).split('\n')
+        ]
+        return [phrase for phrase in cleaned_phrases if 3 <= len(phrase) <= 80]
 
 
 class ImagePreprocessor:
@@ -878,6 +1180,22 @@ class ImagePreprocessor:
     @staticmethod
     def detect_image_type(image: np.ndarray) -> str:
         """Detect image type based on visual and content analysis"""
+        visual_type = ImagePreprocessor.detect_image_type_visual(image)
+        if visual_type == "unknown":
+            return visual_type
+
+        # Quick OCR for content analysis
+        try:
+            text = pytesseract.image_to_string(image)
+        except Exception as e:
+            logging.warning(f"Content analysis failed, using visual features: {e}")
+            return visual_type
+
+        return ImagePreprocessor.refine_image_type_from_text(text, visual_type)
+
+    @staticmethod
+    def detect_image_type_visual(image: np.ndarray) -> str:
+        """Detect image type from edge and color features only (no OCR)"""
         try:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
 
@@ -891,47 +1209,6 @@ class ImagePreprocessor:
             )
             color_diversity = np.count_nonzero(hist) / hist.size
 
-            # Quick OCR for content analysis
-            try:
-                import pytesseract
-                text = pytesseract.image_to_string(image).lower()
-                
-                # Content-based detection
-                google_maps_indicators = [
-                    'overview', 'menu', 'reviews', 'photos', 'directions',
-                    'call', 'website', 'hours', 'rating', 'stars',
-                    'restaurant', 'cafe', 'open', 'closed', 'min'
-                ]
-                
-                social_media_indicators = [
-                    'like', 'comment', 'share', 'follow', 'post',
-                    '@', '#', 'ago', 'minutes', 'hours', 'days',
-                    'story', 'feed', 'timeline'
-                ]
-                
-                travel_indicators = [
-                    'day 1', 'day 2', 'day 3', 'itinerary', 'trip',
-                    'hotel', 'lodge', 'trail', 'park', 'visitor center',
-                    '推荐', '住', '第一天', '第二天', 'national park'
-                ]
-                
-                # Count indicators
-                google_score = sum(1 for indicator in google_maps_indicators if indicator in text)
-                social_score = sum(1 for indicator in social_media_indicators if indicator in text)
-                travel_score = sum(1 for indicator in travel_indicators if indicator in text)
-                
-                # Content-based classification
-                if google_score >= 2:
-                    return "google_maps"
-                elif travel_score >= 2:
-                    return "travel_itinerary"
-                elif social_score >= 2:
-                    return "social_media"
-                    
-            except Exception as e:
-                logging.warning(f"Content analysis failed, using visual features: {e}")
-            
-            # Fallback to visual features
             if edge_density > 0.1 and color_diversity > 0.3:
                 return "map_screenshot"
             elif edge_density < 0.05:
@@ -943,62 +1220,83 @@ class ImagePreprocessor:
             logging.error(f"Image type detection failed: {e}")
             return "unknown"
 
+    @staticmethod
+    def refine_image_type_from_text(text: str, visual_type: str) -> str:
+        """Refine a visual image type using the OCR text of the image"""
+        scores = count_content_indicators(text.lower())
+
+        # Content-based classification
+        if scores["google_maps"] >= 2:
+            return "google_maps"
+        elif scores["travel_itinerary"] >= 2:
+            return "travel_itinerary"
+        elif scores["social_media"] >= 2:
+            return "social_media"
+
+        # Fall back to visual features
+        return visual_type
+
     @staticmethod
     def enhance_image_advanced(
         image: np.ndarray, image_type: str = "mixed_content"
     ) -> np.ndarray:
         """Advanced image enhancement based on image type"""
-        # Convert to PIL image
-        pil_image = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
-
         if image_type == "text_heavy":
             # Text-heavy images: enhance contrast and sharpness
-            enhancer = ImageEnhance.Contrast(pil_image)
-            pil_image = enhancer.enhance(1.8)
-
-            enhancer = ImageEnhance.Sharpness(pil_image)
-            pil_image = enhancer.enhance(2.0)
+            image = ImagePreprocessor.adjust_contrast(image, 1.8)
+            image = ImagePreprocessor.adjust_sharpness(image, 2.0)
 
         elif image_type == "map_screenshot":
             # Map screenshots: moderate enhancement, maintain color balance
-            enhancer = ImageEnhance.Contrast(pil_image)
-            pil_image = enhancer.enhance(1.3)
-
-            enhancer = ImageEnhance.Color(pil_image)
-            pil_image = enhancer.enhance(1.1)
+            image = ImagePreprocessor.adjust_contrast(image, 1.3)
+            image = ImagePreprocessor.adjust_color(image, 1.1)
 
         else:
             # Mixed content: balanced enhancement
-            enhancer = ImageEnhance.Contrast(pil_image)
-            pil_image = enhancer.enhance(1.5)
+            image = ImagePreprocessor.adjust_contrast(image, 1.5)
+            image = ImagePreprocessor.adjust_sharpness(image, 1.2)
 
-            enhancer = ImageEnhance.Sharpness(pil_image)
-            pil_image = enhancer.enhance(1.2)
+        return image
+
+    # The adjustments below match PIL's ImageEnhance (blend of the image with a
+    # degenerate version by `factor`), fused into single OpenCV passes on BGR data
 
-        return cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+    @staticmethod
+    def adjust_contrast(image: np.ndarray, factor: float) -> np.ndarray:
+        """ImageEnhance.Contrast as one lookup table around the mean luminance"""
+        mean = np.float32(int(cv2.mean(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY))[0] + 0.5))
+        lut = mean + np.float32(factor) * (np.arange(256, dtype=np.float32) - mean)
+        return cv2.LUT(image, np.clip(lut, 0, 255).astype(np.uint8))
+
+    @staticmethod
+    def adjust_sharpness(image: np.ndarray, factor: float) -> np.ndarray:
+        """ImageEnhance.Sharpness as one convolution; border pixels are kept as-is"""
+        kernel = factor * IDENTITY_KERNEL + (1 - factor) * SMOOTH_KERNEL
+        sharpened = cv2.filter2D(image, -1, kernel)
+        sharpened[0], sharpened[-1] = image[0], image[-1]
+        sharpened[:, 0], sharpened[:, -1] = image[:, 0], image[:, -1]
+        return sharpened
+
+    @staticmethod
+    def adjust_color(image: np.ndarray, factor: float) -> np.ndarray:
+        """ImageEnhance.Color as one per-pixel 3x3 channel transform"""
+        matrix = factor * np.eye(3, dtype=np.float32) + (1 - factor) * BGR_LUMA_ROWS
+        return cv2.transform(image, matrix)
 
     @staticmethod
     def denoise_image_advanced(image: np.ndarray) -> np.ndarray:
         """Advanced noise reduction processing"""
-        # Convert to grayscale for denoising
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-
-        # Use scikit-image bilateral denoising (if available)
-        if SKIMAGE_AVAILABLE:
+        # Use the CUDA bilateral filter when a GPU is available
+        if CUDA_AVAILABLE:
             try:
-                denoised_gray = denoise_bilateral(
-                    gray, sigma_color=0.1, sigma_spatial=15, multichannel=False
-                )
-                denoised_gray = (denoised_gray * 255).astype(np.uint8)
+                gpu_image = cv2.cuda_GpuMat()
+                gpu_image.upload(image)
+                return cv2.cuda.bilateralFilter(gpu_image, 9, 75, 75).download()
+            except cv2.error as e:
+                logger.warning(f"CUDA denoising failed, using CPU: {e}")
 
-                # Convert back to color
-                denoised = cv2.cvtColor(denoised_gray, cv2.COLOR_GRAY2BGR)
-            except Exception as e:
-                logger.warning(f"scikit-image denoising failed, using OpenCV: {e}")
-                denoised = cv2.bilateralFilter(image, 9, 75, 75)
-        else:
-            # Use OpenCV bilateral filtering
-            denoised = cv2.bilateralFilter(image, 9, 75, 75)
+        # Use OpenCV bilateral filtering
+        denoised = cv2.bilateralFilter(image, 9, 75, 75)
 
         return denoised
 
@@ -1014,18 +1312,14 @@ class ImagePreprocessor:
         lines = cv2.HoughLines(edges, 1, np.pi / 180, threshold=100)
 
         if lines is not None and len(lines) > 0:
-            # Calculate average angle
-            angles = []
-            for line in lines[:10]:  # Only use first 10 lines
-                if len(line) >= 2:  # Ensure line has at least 2 values
-                    rho, theta = line[0], line[1]
-                    angle = theta * 180 / np.pi
-                    if angle > 90:
-                        angle = angle - 180
-                    angles.append(angle)
-
-            if angles:
-                median_angle = np.median(angles)
+            # HoughLines returns (N, 1, 2) rows of (rho, theta), where theta is the
+            # angle of the line's normal: horizontal text lines sit at 90 degrees.
+            # Skew is the offset from horizontal, over near-horizontal lines only.
+            angles = np.rad2deg(lines.reshape(-1, 2)[:, 1]) - 90
+            angles = angles[np.abs(angles) < 45][:10]  # Only use first 10 lines
+
+            if angles.size:
+                median_angle = float(np.median(angles))
 
                 # If skew angle exceeds threshold, perform rotation
                 if abs(median_angle) > 1:
@@ -1061,15 +1355,27 @@ class ImagePreprocessor:
     @staticmethod
     def preprocess_for_ocr(image_path: str) -> np.ndarray:
         """Complete OCR preprocessing pipeline"""
+        return ImagePreprocessor.preprocess_with_type(image_path)[0]
+
+    @staticmethod
+    def preprocess_with_type(image_path: str) -> Tuple[np.ndarray, str]:
+        """
+        Preprocessing pipeline that also returns the visual image type. The
+        type is refined from the OCR text later, so no OCR runs here.
+        """
         # Read image
         image = cv2.imread(image_path)
         if image is None:
             raise ValueError(f"Unable to read image: {image_path}")
 
         logger.info(f"Starting image processing: {image_path}")
+        return ImagePreprocessor.preprocess_image_with_type(image)
 
+    @staticmethod
+    def preprocess_image_with_type(image: np.ndarray) -> Tuple[np.ndarray, str]:
+        """preprocess_with_type for an already decoded BGR image; the input is not modified"""
         # Detect image type
-        image_type = ImagePreprocessor.detect_image_type(image)
+        image_type = ImagePreprocessor.detect_image_type_visual(image)
         logger.info(f"Detected image type: {image_type}")
 
         # Adjust image size
@@ -1097,7 +1403,12 @@ class ImagePreprocessor:
             image = ImagePreprocessor.remove_noise_morphology(image)
 
         logger.info("Image preprocessing completed")
-        return image
+        return image, image_type
+
+
+# Persistent tesserocr handles keyed by language, so each model loads once per process
+_tesserocr_apis = {}
+_tesserocr_lock = threading.Lock()
 
 
 class TesseractOCR:
@@ -1105,67 +1416,82 @@ class TesseractOCR:
 
     def __init__(self):
         # Configure Tesseract for better English and Chinese support
-        self.english_config = "--oem 3 --psm 6 -l eng"
-        self.chinese_config = "--oem 3 --psm 6 -l chi_sim+eng"
-        self.mixed_config = "--oem 3 --psm 6 -l chi_sim+chi_tra+eng"
+        self.english_lang = "eng"
+        self.chinese_lang = "chi_sim+eng"
+        self.mixed_lang = "chi_sim+chi_tra+eng"
+        self.english_config = f"--oem 3 --psm 6 -l {self.english_lang}"
+        self.chinese_config = f"--oem 3 --psm 6 -l {self.chinese_lang}"
+        self.mixed_config = f"--oem 3 --psm 6 -l {self.mixed_lang}"
 
-    def detect_language(self, image: np.ndarray) -> str:
-        """Detect primary language in image"""
-        try:
-            pil_image = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
-            # Quick detection with English first
-            eng_text = pytesseract.image_to_string(
-                pil_image, config=self.english_config
+    @staticmethod
+    def _set_tesserocr_image(api, pixels: np.ndarray):
+        """Hand raw RGB or grayscale pixels to tesserocr without a PIL round trip"""
+        height, width = pixels.shape[:2]
+        channels = 1 if pixels.ndim == 2 else pixels.shape[2]
+        api.SetImageBytes(pixels.tobytes(), width, height, channels, width * channels)
+
+    def recognize(self, pixels: np.ndarray, lang: str, config: str) -> Tuple[str, float]:
+        """
+        Run one Tesseract pass over RGB or grayscale pixels and return
+        (text, average word confidence 0-1). With tesserocr the loaded API is
+        reused and confidences come from the same pass; otherwise pytesseract
+        runs the string and data commands.
+        """
+        if TESSEROCR_AVAILABLE:
+            with _tesserocr_lock:
+                api = _tesserocr_apis.get(lang)
+                if api is None:
+                    api = PyTessBaseAPI(lang=lang, psm=PSM.SINGLE_BLOCK, oem=OEM.DEFAULT)
+                    _tesserocr_apis[lang] = api
+                self._set_tesserocr_image(api, pixels)
+                text = api.GetUTF8Text()
+                word_confidences = api.AllWordConfidences()
+        else:
+            pil_image = Image.fromarray(pixels)
+            text = pytesseract.image_to_string(pil_image, config=config)
+            data = pytesseract.image_to_data(
+                pil_image, config=config, output_type=pytesseract.Output.DICT
             )
+            word_confidences = [int(conf) for conf in data["conf"]]
 
-            # Check for Chinese characters
-            chinese_chars = len(re.findall(r"[\u4e00-\u9fff]", eng_text))
-            english_chars = len(re.findall(r"[a-zA-Z]", eng_text))
+        confidences = [conf for conf in word_confidences if conf > 0]
+        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+        return text, avg_confidence / 100.0  # Convert to 0-1 range
 
-            if (
-                chinese_chars > english_chars * 0.3
-            ):  # If Chinese chars > 30% of English chars
-                return "mixed"
-            elif chinese_chars > 0:
-                return "mixed"
-            else:
-                return "english"
-        except:
+    @staticmethod
+    def language_from_probe_text(eng_text: str) -> str:
+        """Decide the language from an English-config OCR pass"""
+        # Check for Chinese characters
+        chinese_chars = len(CJK_CHAR_RE.findall(eng_text))
+        english_chars = len(LATIN_CHAR_RE.findall(eng_text))
+
+        if (
+            chinese_chars > english_chars * 0.3
+        ):  # If Chinese chars > 30% of English chars
+            return "mixed"
+        elif chinese_chars > 0:
+            return "mixed"
+        else:
             return "english"
 
     def extract_text(self, image: np.ndarray) -> OCRResult:
         """Extract text from image with intelligent language detection"""
         try:
-            # Convert to PIL image
-            pil_image = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+            # Convert to RGB once; both passes read the same pixels
+            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
-            # Detect language
-            detected_lang = self.detect_language(image)
+            # The English pass doubles as language detection; when no Chinese
+            # shows up it is already the final result
+            text, confidence = self.recognize(rgb_image, self.english_lang, self.english_config)
+            lang_code = "en"
 
-            # Choose appropriate config
-            if detected_lang == "mixed":
-                config = self.mixed_config
+            if self.language_from_probe_text(text) == "mixed":
+                text, confidence = self.recognize(rgb_image, self.mixed_lang, self.mixed_config)
                 lang_code = "mixed"
-            elif detected_lang == "chinese":
-                config = self.chinese_config
-                lang_code = "zh"
-            else:
-                config = self.english_config
-                lang_code = "en"
-
-            # Extract text
-            text = pytesseract.image_to_string(pil_image, config=config)
-
-            # Get confidence information
-            data = pytesseract.image_to_data(
-                pil_image, config=config, output_type=pytesseract.Output.DICT
-            )
-            confidences = [int(conf) for conf in data["conf"] if int(conf) > 0]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
 
             return OCRResult(
                 text=text.strip(),
-                confidence=avg_confidence / 100.0,  # Convert to 0-1 range
+                confidence=confidence,
                 language=lang_code,
             )
 
@@ -1173,6 +1499,87 @@ class TesseractOCR:
             logger.error(f"Tesseract OCR error: {e}")
             return OCRResult(text="", confidence=0.0)
 
+    def extract_text_batch(self, images: List[np.ndarray]) -> List[OCRResult]:
+        """
+        Extract text from several images, running Tesseract once per language
+        group over an image-list file instead of once per image
+        """
+        # tesserocr already keeps the models loaded, so per-image calls are cheap there
+        if len(images) <= 1 or TESSEROCR_AVAILABLE:
+            return [self.extract_text(image) for image in images]
+
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                image_files = []
+                for i, image in enumerate(images):
+                    image_file = os.path.join(tmp_dir, f"image_{i}.png")
+                    cv2.imwrite(image_file, image)
+                    image_files.append(image_file)
+
+                # The English pass doubles as the language detection probe
+                english_list = self._write_image_list(image_files, tmp_dir, "english")
+                english_texts = self._image_list_to_strings(english_list, len(images), self.english_config)
+                languages = [self.language_from_probe_text(text) for text in english_texts]
+
+                results = [None] * len(images)
+                english_indices = [i for i, lang in enumerate(languages) if lang == "english"]
+                mixed_indices = [i for i, lang in enumerate(languages) if lang == "mixed"]
+
+                if english_indices:
+                    if len(english_indices) < len(images):
+                        english_list = self._write_image_list(
+                            [image_files[i] for i in english_indices], tmp_dir, "english_only"
+                        )
+                    confidences = self._image_list_confidences(english_list, len(english_indices), self.english_config)
+                    for i, confidence in zip(english_indices, confidences):
+                        results[i] = OCRResult(text=english_texts[i].strip(), confidence=confidence, language="en")
+
+                if mixed_indices:
+                    mixed_list = self._write_image_list(
+                        [image_files[i] for i in mixed_indices], tmp_dir, "mixed"
+                    )
+                    texts = self._image_list_to_strings(mixed_list, len(mixed_indices), self.mixed_config)
+                    confidences = self._image_list_confidences(mixed_list, len(mixed_indices), self.mixed_config)
+                    for i, text, confidence in zip(mixed_indices, texts, confidences):
+                        results[i] = OCRResult(text=text.strip(), confidence=confidence, language="mixed")
+
+                return results
+
+        except Exception as e:
+            logger.warning(f"Batch Tesseract OCR failed, processing images one by one: {e}")
+            return [self.extract_text(image) for image in images]
+
+    @staticmethod
+    def _write_image_list(image_files: List[str], tmp_dir: str, name: str) -> str:
+        """Write a Tesseract image-list file and return its path"""
+        list_file = os.path.join(tmp_dir, f"{name}.txt")
+        with open(list_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(image_files))
+        return list_file
+
+    @staticmethod
+    def _image_list_to_strings(list_file: str, count: int, config: str) -> List[str]:
+        """OCR every image in a list file; Tesseract separates pages with form feeds"""
+        pages = pytesseract.image_to_string(list_file, config=config).split("\f")
+        if len(pages) < count:
+            raise ValueError(f"Tesseract returned {len(pages)} pages for {count} images")
+        return pages[:count]
+
+    @staticmethod
+    def _image_list_confidences(list_file: str, count: int, config: str) -> List[float]:
+        """Average word confidence (0-1) per image in a list file"""
+        data = pytesseract.image_to_data(
+            list_file, config=config, output_type=pytesseract.Output.DICT
+        )
+        page_confidences = [[] for _ in range(count)]
+        for page_num, conf in zip(data["page_num"], data["conf"]):
+            if int(conf) > 0:
+                page_confidences[int(page_num) - 1].append(int(conf))
+        return [
+            sum(confidences) / len(confidences) / 100.0 if confidences else 0.0
+            for confidences in page_confidences
+        ]
+
 
 class PaddleOCR_Processor:
     """PaddleOCR Processor"""
@@ -1182,9 +1589,12 @@ class PaddleOCR_Processor:
             from paddleocr import PaddleOCR
 
             # Initialize PaddleOCR with Chinese and English support
+            self.rec_batch_num = 16  # Text crops per recognizer forward pass
             self.ocr = PaddleOCR(
-                use_angle_cls=True, lang="ch"
+                use_angle_cls=True, lang="ch", rec_batch_num=self.rec_batch_num
             )  # ch supports Chinese-English mixed text
+            # The predictors are not safe to run from several threads at once
+            self._ocr_lock = threading.Lock()
             self.available = True
         except ImportError:
             logger.warning("PaddleOCR not available, will use Tesseract")
@@ -1197,33 +1607,49 @@ class PaddleOCR_Processor:
 
         try:
             # PaddleOCR processing
-            result = self.ocr.ocr(image, cls=True)
+            with self._ocr_lock:
+                result = self.ocr.ocr(image, cls=True)
 
-            if not result or not result[0]:
+            if not result:
                 return OCRResult(text="", confidence=0.0)
 
-            # Extract text and confidence
-            texts = []
-            confidences = []
-
-            for line in result[0]:
-                if line:
-                    text = line[1][0]  # Text content
-                    conf = line[1][1]  # Confidence
-                    texts.append(text)
-                    confidences.append(conf)
-
-            combined_text = "\n".join(texts)
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-
-            return OCRResult(
-                text=combined_text, confidence=avg_confidence, language="ch"
-            )
+            return self._pack(result[0])
 
         except Exception as e:
             logger.error(f"PaddleOCR error: {e}")
             return OCRResult(text="", confidence=0.0)
 
+    def extract_text_batch(self, images: List[np.ndarray]) -> List[OCRResult]:
+        """Extract text from several images, one PaddleOCR call per image"""
+        # PaddleOCR exits the process when given a list of images with detection
+        # on, so images go through one at a time; the text crops within each
+        # image are still recognized rec_batch_num at a time
+        return [self.extract_text(image) for image in images]
+
+    @staticmethod
+    def _pack(page) -> OCRResult:
+        """Build an OCRResult from PaddleOCR's lines for one image"""
+        if not page:
+            return OCRResult(text="", confidence=0.0)
+
+        # Extract text and confidence
+        texts = []
+        confidences = []
+
+        for line in page:
+            if line:
+                text = line[1][0]  # Text content
+                conf = line[1][1]  # Confidence
+                texts.append(text)
+                confidences.append(conf)
+
+        combined_text = "\n".join(texts)
+        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+
+        return OCRResult(
+            text=combined_text, confidence=avg_confidence, language="ch"
+        )
+
 
 class TextProcessor:
     """Enhanced text post-processor with intelligent filtering and classification"""
@@ -1251,52 +1677,36 @@ class TextProcessor:
     @staticmethod
     def fix_common_ocr_errors(text: str) -> str:
         """Fix common OCR recognition errors"""
-        # Common character confusion fixes
-        error_corrections = {
-            # Number and letter confusion
-            r"\b0(?=[A-Za-z])": "O",  # 0 -> O (before letters)
-            r"(?<=[A-Za-z])0\b": "O",  # 0 -> O (after letters)
-            r"\b1(?=l|I)": "I",  # 1 -> I
-            r"5(?=S|s)": "S",  # 5 -> S
-            r"8(?=B|b)": "B",  # 8 -> B
-            # Punctuation fixes
-            r"(?<=\w),(?=\w)": ", ",  # Add space after comma
-            r"(?<=\w)\.(?=[A-Z])": ". ",  # Add space after period
-            # Common word fixes
-            r"\bRestaurant\b": "Restaurant",
-            r"\bCafe\b": "Cafe",
-            r"\bStreet\b": "Street",
-            r"\bAvenue\b": "Avenue",
-        }
-
-        for pattern, replacement in error_corrections.items():
-            text = re.sub(pattern, replacement, text)
+        # Common character confusion, then punctuation fixes
+        text = fix_ocr_digit_confusions(text)
+        for pattern, replacement in OCR_ERROR_CORRECTIONS:
+            text = pattern.sub(replacement, text)
 
         return text
 
     def clean_text(self, text: str) -> str:
         """Clean and standardize text with intelligent filtering"""
-        if not text:
+        if not text or text.isspace():
             return ""
 
         # Remove excess whitespace characters
-        text = re.sub(r"\s+", " ", text)
+        text = WHITESPACE_RE.sub(" ", text)
 
         # Fix common OCR errors
         text = self.fix_common_ocr_errors(text)
 
-        # Apply intelligent filtering for Google Maps UI elements
-        text = self.text_filter.filter_google_maps_ui(text)
+        # Apply intelligent filtering for Google Maps UI elements (only if any can match)
+        if GOOGLE_MAPS_UI_ANY_RE.search(text):
+            text = self.text_filter.filter_google_maps_ui(text)
         text = self.text_filter.clean_ocr_artifacts(text)
 
         # Remove meaningless character combinations
-        text = re.sub(r"[^\w\s.,!?@#$%^&*()_+\-=\[\]{}|;:\'\"<>/\\·•★☆]", "", text)
+        text = MEANINGLESS_CHARS_RE.sub("", text)
 
-        # Fix line break issues
-        text = re.sub(
-            r"(?<=[a-z])\n(?=[a-z])", " ", text
-        )  # Line breaks in the middle of words
-        text = re.sub(r"\n+", "\n", text)  # Merge multiple line breaks
+        # Fix line break issues (the whitespace pass above normally removes them all)
+        if "\n" in text:
+            text = MID_WORD_LINE_BREAK_RE.sub(" ", text)  # Line breaks in the middle of words
+            text = LINE_BREAKS_RE.sub("\n", text)  # Merge multiple line breaks
 
         return text.strip()
 
@@ -1310,38 +1720,18 @@ class TextProcessor:
         
         # Combine results into a single list with priorities
         all_extractions = []
+        for category, extractions in hierarchical_results.items():
+            priority = HIERARCHY_PRIORITIES[category]
+            for extraction in extractions:
+                extraction["priority"] = priority
+            all_extractions.extend(extractions)
         
-        # Add businesses (highest priority)
-        for business in hierarchical_results["businesses"]:
-            business["priority"] = 1
-            all_extractions.append(business)
+        # Top 15 by priority first, then by confidence (same order as a stable sort)
+        top_extractions = heapq.nsmallest(15, all_extractions, key=lambda x: (x["priority"], -x["confidence"]))
         
-        # Add addresses (second priority)
-        for address in hierarchical_results["addresses"]:
-            address["priority"] = 2
-            all_extractions.append(address)
-        
-        # Add areas (third priority)
-        for area in hierarchical_results["areas"]:
-            area["priority"] = 3
-            all_extractions.append(area)
-        
-        # Add landmarks (fourth priority)
-        for landmark in hierarchical_results["landmarks"]:
-            landmark["priority"] = 3  # Same priority as areas
-            all_extractions.append(landmark)
-        
-        # Add other locations (lowest priority)
-        for other in hierarchical_results["other"]:
-            other["priority"] = 4
-            all_extractions.append(other)
-        
-        # Sort by priority first, then by confidence
-        all_extractions.sort(key=lambda x: (x["priority"], -x["confidence"]))
-        
-        # Limit total results and remove low-confidence items
+        # Remove low-confidence items
         filtered_extractions = [
-            extraction for extraction in all_extractions[:15]
+            extraction for extraction in top_extractions
             if extraction["confidence"] >= 0.3
         ]
         
@@ -1354,18 +1744,12 @@ class TextProcessor:
     def extract_ratings_and_reviews(self, text: str) -> List[Dict[str, any]]:
         """Extract rating and review information"""
         ratings = []
+        matching = matching_text_patterns(text)
 
-        # Rating patterns
-        rating_patterns = [
-            r"(\d+\.?\d*)\s*(?:stars?|★|☆)",  # X stars, X★
-            r"(\d+\.?\d*)\s*/\s*5",  # X/5
-            r"(\d+\.?\d*)\s*/\s*10",  # X/10
-            r"Rating:\s*(\d+\.?\d*)",  # Rating: X
-        ]
-
-        for pattern in rating_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in RATING_PATTERNS:
+            if matching is not None and pattern not in matching:
+                continue
+            for match in pattern.finditer(text):
                 rating_value = float(match.group(1))
                 if 0 <= rating_value <= 10:  # Reasonable rating range
                     ratings.append(
@@ -1384,33 +1768,29 @@ class TextProcessor:
         """Extract contact information"""
         contact_info = {"phones": [], "emails": [], "websites": [], "hours": []}
 
-        # Phone number patterns
-        phone_patterns = [
-            r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",  # US phone format
-            r"\+?\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}",  # International phone
-        ]
-
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
-            contact_info["phones"].extend(phones)
-
-        # Email pattern
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        contact_info["emails"] = re.findall(email_pattern, text)
-
-        # Website pattern
-        website_pattern = r"https?://[^\s]+|www\.[^\s]+"
-        contact_info["websites"] = re.findall(website_pattern, text)
-
-        # Business hours patterns
-        hours_patterns = [
-            r"(?:Open|Hours?):?\s*\d{1,2}:?\d{0,2}\s*(?:AM|PM|am|pm)?\s*-\s*\d{1,2}:?\d{0,2}\s*(?:AM|PM|am|pm)?",
-            r"\d{1,2}:?\d{0,2}\s*(?:AM|PM|am|pm)\s*-\s*\d{1,2}:?\d{0,2}\s*(?:AM|PM|am|pm)",
-        ]
-
-        for pattern in hours_patterns:
-            hours = re.findall(pattern, text, re.IGNORECASE)
-            contact_info["hours"].extend(hours)
+        # Only run the patterns that can match: with Hyperscan one pass over the
+        # text says which ones do; otherwise phones and hours need digits,
+        # emails an "@" and websites a scheme or "www."
+        matching = matching_text_patterns(text)
+        if matching is None:
+            has_digits = DIGIT_RE.search(text) is not None
+            matching = (PHONE_PATTERNS + HOURS_PATTERNS if has_digits else ()) + (
+                (EMAIL_RE,) if "@" in text else ()
+            ) + ((WEBSITE_RE,) if "http" in text or "www." in text else ())
+
+        for pattern in PHONE_PATTERNS:
+            if pattern in matching:
+                contact_info["phones"].extend(pattern.findall(text))
+
+        if EMAIL_RE in matching:
+            contact_info["emails"] = EMAIL_RE.findall(text)
+        if WEBSITE_RE in matching:
+            contact_info["websites"] = WEBSITE_RE.findall(text)
+
+        # Business hours
+        for pattern in HOURS_PATTERNS:
+            if pattern in matching:
+                contact_info["hours"].extend(pattern.findall(text))
 
         return contact_info
 
@@ -1448,9 +1828,13 @@ class OCRProcessor:
         self.paddle = PaddleOCR_Processor()
         self.preprocessor = ImagePreprocessor()
         self.text_processor = TextProcessor()
+        self.content_processor = ContentAwareProcessor()
+        # (content digest, engine) -> (visual image type, OCRResult), oldest first
+        self._ocr_cache = OrderedDict()
+        self._ocr_cache_lock = threading.Lock()
 
     def process_image(
-        self, image_path: str, engine: str = "auto"
+        self, image_path: str, engine: str = "auto", use_cache: bool = True
     ) -> ProcessedOCRResult:
         """
         Process image and return structured results with enhanced intelligence
@@ -1458,131 +1842,334 @@ class OCRProcessor:
         Args:
             image_path: Image file path
             engine: OCR engine ("tesseract", "paddle", "auto")
+            use_cache: Reuse the OCR output of an earlier image with the same bytes
         """
         try:
             logger.info(f"Starting enhanced OCR processing for {image_path}")
             
-            # Image preprocessing
-            processed_image = self.preprocessor.preprocess_for_ocr(image_path)
-
-            # Select OCR engine
-            if engine == "auto":
-                # Prefer PaddleOCR (better Chinese support)
-                if self.paddle.available:
-                    ocr_result = self.paddle.extract_text(processed_image)
-                    engine_used = "paddle"
+            engine_used = self.resolved_engine(engine)
+            cache_key = self._file_cache_key(image_path, engine_used) if use_cache else None
+            cached = self._cached_ocr(cache_key)
+            if cached is not None:
+                image_type, ocr_result = cached
+                return self._build_result(image_path, image_type, ocr_result, engine_used)
+
+            # Image preprocessing; the visual type is refined from the OCR text later
+            processed_image, image_type = self.preprocessor.preprocess_with_type(image_path)
+            return self._recognize(image_path, processed_image, image_type, engine_used, cache_key)
+
+        except Exception as e:
+            return self._failed_result(image_path, e)
+
+    def process_image_array(
+        self, image: np.ndarray, engine: str = "auto", image_label: str = "<array>",
+        use_cache: bool = True
+    ) -> ProcessedOCRResult:
+        """
+        Process an already decoded BGR image, e.g. one image tried with several engines
+
+        Args:
+            image: Image as read by cv2.imread (not modified)
+            engine: OCR engine ("tesseract", "paddle", "auto")
+            image_label: Name used for the image in logs
+            use_cache: Reuse the OCR output of an earlier identical image
+        """
+        try:
+            logger.info(f"Starting enhanced OCR processing for {image_label}")
+            engine_used = self.resolved_engine(engine)
+            cache_key = self._array_cache_key(image, engine_used) if use_cache else None
+            cached = self._cached_ocr(cache_key)
+            if cached is not None:
+                image_type, ocr_result = cached
+                return self._build_result(image_label, image_type, ocr_result, engine_used)
+
+            processed_image, image_type = self.preprocessor.preprocess_image_with_type(image)
+            return self._recognize(image_label, processed_image, image_type, engine_used, cache_key)
+
+        except Exception as e:
+            return self._failed_result(image_label, e)
+
+    def _recognize(
+        self, image_path: str, processed_image: np.ndarray, image_type: str,
+        engine_used: str, cache_key: Optional[tuple] = None
+    ) -> ProcessedOCRResult:
+        """Run the selected OCR engine over a preprocessed image and build the result"""
+        if engine_used == "paddle":
+            ocr_result = self.paddle.extract_text(processed_image)
+        else:
+            ocr_result = self.tesseract.extract_text(processed_image)
+
+        self._store_ocr(cache_key, image_type, ocr_result)
+        return self._build_result(image_path, image_type, ocr_result, engine_used)
+
+    @staticmethod
+    def _file_cache_key(image_path: str, engine_used: str) -> Optional[tuple]:
+        """OCR cache key for an image file, or None if it can't be read"""
+        try:
+            with open(image_path, "rb") as f:
+                digest = blake2b(f.read(), digest_size=16).digest()
+        except OSError:
+            return None  # Left to preprocessing to report
+        return digest, engine_used
+
+    @staticmethod
+    def _array_cache_key(image: np.ndarray, engine_used: str) -> tuple:
+        """OCR cache key for a decoded image"""
+        digest = blake2b(np.ascontiguousarray(image), digest_size=16).digest()
+        return digest, image.shape, image.dtype.str, engine_used
+
+    def _cached_ocr(self, cache_key: Optional[tuple]):
+        """(visual image type, OCRResult) cached under the key, or None"""
+        if cache_key is None:
+            return None
+        with self._ocr_cache_lock:
+            cached = self._ocr_cache.get(cache_key)
+            if cached is not None:
+                self._ocr_cache.move_to_end(cache_key)
+            return cached
+
+    def _store_ocr(self, cache_key: Optional[tuple], image_type: str, ocr_result: OCRResult):
+        """
+        Cache an OCR engine output, dropping the least recently used entry when
+        full; empty output is not cached so failures get retried
+        """
+        if cache_key is None or not ocr_result.text.strip():
+            return
+        with self._ocr_cache_lock:
+            self._ocr_cache[cache_key] = (image_type, ocr_result)
+            self._ocr_cache.move_to_end(cache_key)
+            if len(self._ocr_cache) > OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
+
+    def process_images(
+        self, image_paths: List[str], engine: str = "auto", use_cache: bool = True,
+        cache_get: Optional[Callable[[str, str], Optional[Tuple[str, OCRResult]]]] = None,
+        cache_put: Optional[Callable[[str, str, str, OCRResult], None]] = None,
+    ) -> List[ProcessedOCRResult]:
+        """
+        Process several images, sharing OCR engine runs across the batch
+
+        Args:
+            image_paths: Image file paths
+            engine: OCR engine ("tesseract", "paddle", "auto")
+            use_cache: Reuse the OCR output of earlier images with the same bytes
+            cache_get: Extra OCR output cache consulted after the in-memory one,
+                called as cache_get(image_path, engine_used) and returning
+                (visual image type, OCRResult) or None
+            cache_put: Called as cache_put(image_path, engine_used, image_type,
+                ocr_result) for every image the engine OCRs
+
+        Returns:
+            List[ProcessedOCRResult]: One result per path, in input order
+        """
+        results = [None] * len(image_paths)
+        engine_used = self.resolved_engine(engine)
+
+        # Images seen before only need their cached OCR output post-processed
+        cache_keys = [None] * len(image_paths)
+        pending = []  # (index, image_path)
+        for i, image_path in enumerate(image_paths):
+            cache_key = self._file_cache_key(image_path, engine_used) if use_cache else None
+            cached = self._cached_ocr(cache_key)
+            if cached is None and cache_get is not None:
+                try:
+                    cached = cache_get(image_path, engine_used)
+                except Exception as e:
+                    logger.warning(f"OCR cache lookup failed for {image_path}: {e}")
+            if cached is None:
+                cache_keys[i] = cache_key
+                pending.append((i, image_path))
+                continue
+            image_type, ocr_result = cached
+            try:
+                results[i] = self._build_result(image_path, image_type, ocr_result, engine_used)
+            except Exception as e:
+                results[i] = self._failed_result(image_path, e)
+
+        # Image preprocessing (file IO and OpenCV release the GIL, so threads overlap)
+        prepared = []  # (index, image_path, (processed_image, image_type))
+        with ThreadPoolExecutor(max_workers=min(len(pending), PREPROCESS_THREADS) or 1) as executor:
+            outcomes = executor.map(self._preprocess_or_fail, [image_path for _, image_path in pending])
+            for (i, image_path), outcome in zip(pending, outcomes):
+                if isinstance(outcome, ProcessedOCRResult):
+                    results[i] = outcome
                 else:
-                    ocr_result = self.tesseract.extract_text(processed_image)
-                    engine_used = "tesseract"
-            elif engine == "paddle" and self.paddle.available:
-                ocr_result = self.paddle.extract_text(processed_image)
-                engine_used = "paddle"
+                    prepared.append((i, image_path, outcome))
+
+        if not prepared:
+            return results
+
+        # Run the selected OCR engine over the whole batch
+        images = [processed_image for _, _, (processed_image, _) in prepared]
+        try:
+            if engine_used == "paddle":
+                ocr_results = self.paddle.extract_text_batch(images)
             else:
-                ocr_result = self.tesseract.extract_text(processed_image)
-                engine_used = "tesseract"
+                ocr_results = self.tesseract.extract_text_batch(images)
+        except Exception as e:
+            for i, image_path, _ in prepared:
+                results[i] = self._failed_result(image_path, e)
+            return results
+
+        for (i, image_path, (_, image_type)), ocr_result in zip(prepared, ocr_results):
+            self._store_ocr(cache_keys[i], image_type, ocr_result)
+            if cache_put is not None:
+                try:
+                    cache_put(image_path, engine_used, image_type, ocr_result)
+                except Exception as e:
+                    logger.warning(f"OCR cache store failed for {image_path}: {e}")
+            try:
+                results[i] = self._build_result(image_path, image_type, ocr_result, engine_used)
+            except Exception as e:
+                results[i] = self._failed_result(image_path, e)
 
-            logger.info(f"OCR extraction completed with {engine_used}, confidence: {ocr_result.confidence:.2f}")
-            logger.info(f"Raw text length: {len(ocr_result.text)}")
+        return results
 
-            # Enhanced text post-processing
-            cleaned_text = self.text_processor.clean_text(ocr_result.text)
-            logger.info(f"Cleaned text length: {len(cleaned_text)}")
+    def _preprocess_or_fail(self, image_path: str):
+        """Preprocess one image, returning the failed result instead of raising"""
+        try:
+            logger.info(f"Starting enhanced OCR processing for {image_path}")
+            return self.preprocessor.preprocess_with_type(image_path)
+        except Exception as e:
+            return self._failed_result(image_path, e)
+
+    def resolved_engine(self, engine: str) -> str:
+        """Resolve the requested engine to the one that will actually run"""
+        if engine == "auto":
+            # Prefer PaddleOCR (better Chinese support)
+            return "paddle" if self.paddle.available else "tesseract"
+        elif engine == "paddle" and self.paddle.available:
+            return "paddle"
+        return "tesseract"
+
+    def _build_result(
+        self, image_path: str, image_type: str,
+        ocr_result: OCRResult, engine_used: str
+    ) -> ProcessedOCRResult:
+        """Post-process raw OCR output into the structured result"""
+        # Enhanced text post-processing
+        cleaned_text = self.text_processor.clean_text(ocr_result.text)
+
+        # Content-aware processing based on detected image type
+        image_type = ImagePreprocessor.refine_image_type_from_text(ocr_result.text, image_type)
+        processed_content = self.content_processor.process_by_type(cleaned_text, image_type)
+        
+        # Enhanced structured extraction with hierarchical classification
+        advanced_locations = self.text_processor.extract_locations_advanced(processed_content["processed_text"], ocr_result.confidence)
+        
+        # Separate by type for backward compatibility
+        locations = [loc["text"] for loc in advanced_locations]
+        addresses = [loc["text"] for loc in advanced_locations if loc["type"] == "address"]
+        names = [loc["text"] for loc in advanced_locations if loc["type"] == "business"]
+
+        # Build enhanced structured data
+        structured_data = {
+            "locations": locations,
+            "addresses": addresses,
+            "business_names": names,
+            "advanced_extractions": advanced_locations,  # New: detailed classification
+            "extraction_stats": {
+                "total_extractions": len(advanced_locations),
+                "businesses": len([loc for loc in advanced_locations if loc["type"] == "business"]),
+                "addresses": len([loc for loc in advanced_locations if loc["type"] == "address"]),
+                "areas": len([loc for loc in advanced_locations if loc["type"] == "area"]),
+                "avg_confidence": sum(loc["confidence"] for loc in advanced_locations) / len(advanced_locations) if advanced_locations else 0
+            },
+            "has_ratings": bool(DECIMAL_RE.search(cleaned_text)),
+            "has_phone": bool(US_PHONE_RE.search(cleaned_text)),
+            "text_length": len(cleaned_text),
+            "word_count": len(cleaned_text.split()),
+            "engine_used": engine_used
+        }
 
-            # Content-aware processing based on detected image type
-            image_type = ImagePreprocessor.detect_image_type(processed_image)
-            content_processor = ContentAwareProcessor()
-            processed_content = content_processor.process_by_type(cleaned_text, image_type)
-            
-            # Enhanced structured extraction with hierarchical classification
-            advanced_locations = self.text_processor.extract_locations_advanced(processed_content["processed_text"], ocr_result.confidence)
-            
-            # Separate by type for backward compatibility
-            locations = [loc["text"] for loc in advanced_locations]
-            addresses = [loc["text"] for loc in advanced_locations if loc["type"] == "address"]
-            names = [loc["text"] for loc in advanced_locations if loc["type"] == "business"]
-
-            # Build enhanced structured data
-            structured_data = {
-                "locations": locations,
-                "addresses": addresses,
-                "business_names": names,
-                "advanced_extractions": advanced_locations,  # New: detailed classification
+        # Enhanced logging, emitted as one record per image
+        if logger.isEnabledFor(logging.INFO):
+            stats = structured_data['extraction_stats']
+            lines = [
+                f"Enhanced OCR processing completed for {image_path} with {engine_used}:",
+                f"  Raw text length: {len(ocr_result.text)}",
+                f"  Cleaned text length: {len(cleaned_text)}",
+                f"  Total extractions: {len(advanced_locations)}",
+                f"  Businesses found: {stats['businesses']}",
+                f"  Addresses found: {stats['addresses']}",
+                f"  Areas found: {stats['areas']}",
+                f"  Average extraction confidence: {stats['avg_confidence']:.2f}",
+                f"  OCR confidence: {ocr_result.confidence:.2f}",
+            ]
+            if advanced_locations:
+                lines.append("  Top extractions:")
+                lines.extend(
+                    f"    {i+1}. {loc['text']} ({loc['type']}, {loc['confidence']:.2f})"
+                    for i, loc in enumerate(advanced_locations[:5])
+                )
+            logger.info("\n".join(lines))
+
+        return ProcessedOCRResult(
+            raw_text=ocr_result.text,
+            cleaned_text=cleaned_text,
+            structured_data=structured_data,
+            confidence=ocr_result.confidence,
+            detected_locations=locations,
+            detected_addresses=addresses,
+            detected_names=names,
+            locations=[loc['text'] for loc in advanced_locations],  # Add this for backward compatibility
+        )
+
+    @staticmethod
+    def _failed_result(image_path: str, error: Exception) -> ProcessedOCRResult:
+        """Empty result returned when processing an image fails"""
+        # The handler formats the traceback, and only if the record is emitted
+        logger.error("Enhanced OCR processing error for %s: %s", image_path, error, exc_info=error)
+        return ProcessedOCRResult(
+            raw_text="",
+            cleaned_text="",
+            structured_data={
+                "locations": [],
+                "addresses": [],
+                "business_names": [],
+                "advanced_extractions": [],
                 "extraction_stats": {
-                    "total_extractions": len(advanced_locations),
-                    "businesses": len([loc for loc in advanced_locations if loc["type"] == "business"]),
-                    "addresses": len([loc for loc in advanced_locations if loc["type"] == "address"]),
-                    "areas": len([loc for loc in advanced_locations if loc["type"] == "area"]),
-                    "avg_confidence": sum(loc["confidence"] for loc in advanced_locations) / len(advanced_locations) if advanced_locations else 0
+                    "total_extractions": 0,
+                    "businesses": 0,
+                    "addresses": 0,
+                    "areas": 0,
+                    "avg_confidence": 0
                 },
-                "has_ratings": bool(re.search(r"\d+\.\d+", cleaned_text)),
-                "has_phone": bool(re.search(r"\(\d{3}\)\s*\d{3}-\d{4}", cleaned_text)),
-                "text_length": len(cleaned_text),
-                "word_count": len(cleaned_text.split()),
-                "engine_used": engine_used
-            }
+                "has_ratings": False,
+                "has_phone": False,
+                "text_length": 0,
+                "word_count": 0,
+                "engine_used": "none"
+            },
+            confidence=0.0,
+            detected_locations=[],
+            detected_addresses=[],
+            detected_names=[],
+            locations=[],  # Add this for backward compatibility
+        )
 
-            # Enhanced logging
-            logger.info(f"Enhanced OCR processing completed for {image_path}:")
-            logger.info(f"  Raw text length: {len(ocr_result.text)}")
-            logger.info(f"  Cleaned text length: {len(cleaned_text)}")
-            logger.info(f"  Total extractions: {len(advanced_locations)}")
-            logger.info(f"  Businesses found: {structured_data['extraction_stats']['businesses']}")
-            logger.info(f"  Addresses found: {structured_data['extraction_stats']['addresses']}")
-            logger.info(f"  Areas found: {structured_data['extraction_stats']['areas']}")
-            logger.info(f"  Average extraction confidence: {structured_data['extraction_stats']['avg_confidence']:.2f}")
-            logger.info(f"  OCR confidence: {ocr_result.confidence:.2f}")
 
-            if advanced_locations:
-                logger.info("  Top extractions:")
-                for i, loc in enumerate(advanced_locations[:5]):
-                    logger.info(f"    {i+1}. {loc['text']} ({loc['type']}, {loc['confidence']:.2f})")
-
-            return ProcessedOCRResult(
-                raw_text=ocr_result.text,
-                cleaned_text=cleaned_text,
-                structured_data=structured_data,
-                confidence=ocr_result.confidence,
-                detected_locations=locations,
-                detected_addresses=addresses,
-                detected_names=names,
-                locations=[loc['text'] for loc in advanced_locations],  # Add this for backward compatibility
-            )
+# Global OCR processor instance, created on first use since loading the OCR
+# engines is the slow part of importing this module
+_ocr_processor = None
+_ocr_processor_lock = threading.Lock()
 
-        except Exception as e:
-            logger.error(f"Enhanced OCR processing error for {image_path}: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            return ProcessedOCRResult(
-                raw_text="",
-                cleaned_text="",
-                structured_data={
-                    "locations": [],
-                    "addresses": [],
-                    "business_names": [],
-                    "advanced_extractions": [],
-                    "extraction_stats": {
-                        "total_extractions": 0,
-                        "businesses": 0,
-                        "addresses": 0,
-                        "areas": 0,
-                        "avg_confidence": 0
-                    },
-                    "has_ratings": False,
-                    "has_phone": False,
-                    "text_length": 0,
-                    "word_count": 0,
-                    "engine_used": "none"
-                },
-                confidence=0.0,
-                detected_locations=[],
-                detected_addresses=[],
-                detected_names=[],
-                locations=[],  # Add this for backward compatibility
-            )
+
+def get_ocr_processor() -> OCRProcessor:
+    """Return the global OCRProcessor, creating it on the first call"""
+    global _ocr_processor
+    if _ocr_processor is None:
+        with _ocr_processor_lock:
+            if _ocr_processor is None:
+                _ocr_processor = OCRProcessor()
+    return _ocr_processor
 
 
-# Global OCR processor instance
-ocr_processor = OCRProcessor()
+def __getattr__(name: str):
+    """Keep `ocr_processor` importable as a module attribute (PEP 562)"""
+    if name == "ocr_processor":
+        return get_ocr_processor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def process_image_file(image_path: str, engine: str = "auto") -> Dict:
@@ -1592,34 +2179,46 @@ def process_image_file(image_path: str, engine: str = "auto") -> Dict:
     Returns:
         Dict: Dictionary containing enhanced OCR results
     """
-    result = ocr_processor.process_image(image_path, engine)
+    result = get_ocr_processor().process_image(image_path, engine)
+    return _result_to_dict(result)
 
-    # Enhanced success determination
-    has_text = len(result.raw_text.strip()) > 0 or len(result.cleaned_text.strip()) > 0
-    has_extractions = (len(result.detected_locations) > 0 or 
-                      len(result.detected_addresses) > 0 or 
-                      len(result.detected_names) > 0)
-    
-    # More intelligent success criteria
-    high_quality_extractions = []
-    if result.structured_data.get("advanced_extractions"):
-        high_quality_extractions = [
-            ext for ext in result.structured_data["advanced_extractions"]
-            if ext["confidence"] >= 0.5
-        ]
+
+def process_image_array(image: np.ndarray, engine: str = "auto", image_label: str = "<array>") -> Dict:
+    """
+    process_image_file for an already decoded BGR image, so callers trying
+    several engines read and decode the file only once
+
+    Returns:
+        Dict: Dictionary containing enhanced OCR results
+    """
+    result = get_ocr_processor().process_image_array(image, engine, image_label)
+    return _result_to_dict(result)
+
+
+def _result_to_dict(result: ProcessedOCRResult) -> Dict:
+    """Convert a processed OCR result into the API response dictionary"""
+    # Enhanced success determination; isspace() avoids copying the text to strip it
+    has_text = any(text and not text.isspace() for text in (result.raw_text, result.cleaned_text))
+    has_extractions = bool(result.detected_locations or result.detected_addresses or result.detected_names)
     
+    # More intelligent success criteria; one high-quality extraction is enough
+    extractions = result.structured_data.get("advanced_extractions") or ()
     success = (
         has_text and 
         (result.confidence > 0.1 or has_extractions) and
-        (len(high_quality_extractions) > 0 or result.confidence > 0.3)
+        (result.confidence > 0.3 or any(ext["confidence"] >= 0.5 for ext in extractions))
     )
     
-    logger.info(f"Enhanced process image file result:")
-    logger.info(f"  Success: {success}")
-    logger.info(f"  Has text: {has_text}")
-    logger.info(f"  Has extractions: {has_extractions}")
-    logger.info(f"  High quality extractions: {len(high_quality_extractions)}")
-    logger.info(f"  OCR confidence: {result.confidence:.2f}")
+    if logger.isEnabledFor(logging.INFO):
+        high_quality_count = sum(ext["confidence"] >= 0.5 for ext in extractions)
+        logger.info("\n".join([
+            "Enhanced process image file result:",
+            f"  Success: {success}",
+            f"  Has text: {has_text}",
+            f"  Has extractions: {has_extractions}",
+            f"  High quality extractions: {high_quality_count}",
+            f"  OCR confidence: {result.confidence:.2f}",
+        ]))
 
     return {
         "success": success,
@@ -1635,6 +2234,80 @@ def process_image_file(image_path: str, engine: str = "auto") -> Dict:
     }
 
 
+def _init_ocr_worker():
+    """
+    Keep each worker's OpenCV and Tesseract subprocesses single-threaded so
+    workers don't oversubscribe cores; parallelism comes from the processes
+    themselves. tesserocr's OpenMP runtime reads OMP_THREAD_LIMIT when the
+    module is imported, before this runs, so for it the limit has to be in the
+    environment the worker starts with (main.py exports it for the server).
+    """
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    cv2.setNumThreads(1)
+
+
+def _process_image_chunk(image_paths: List[str], engine: str) -> List[Dict]:
+    """Process a chunk of image files as one OCR batch"""
+    return [_result_to_dict(result) for result in get_ocr_processor().process_images(image_paths, engine)]
+
+
+def create_ocr_worker_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Worker process pool for process_image_files, for callers that keep one
+    alive (e.g. the API server). Workers are spawned rather than forked, so
+    they never inherit a parent's loaded OCR models or engine threads.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_ocr_worker,
+    )
+
+
+def process_image_files(image_paths: List[str], engine: str = "auto",
+                        max_workers: Optional[int] = None,
+                        executor: Optional[ProcessPoolExecutor] = None) -> List[Dict]:
+    """
+    Process several image files in parallel worker processes. Each worker
+    gets a contiguous chunk of paths and OCRs it as one batch. Pass a pool
+    from create_ocr_worker_pool as executor to reuse its workers (and their
+    loaded OCR engines) across calls; otherwise a pool is created per call.
+
+    Topology: one process per core (up to one per image), each running
+    single-threaded Tesseract/OpenCV and its own OCRProcessor. Inside a worker,
+    preprocessing overlaps on up to PREPROCESS_THREADS threads, since file IO
+    and OpenCV release the GIL. PaddleOCR runs are the exception: they stay in
+    the calling process on its shared processor, one image at a time, so the
+    model is loaded once instead of once per worker.
+
+    Returns:
+        List[Dict]: One process_image_file result per path, in input order
+    """
+    if not image_paths:
+        return []
+    if len(image_paths) == 1 and executor is None:
+        return [process_image_file(image_paths[0], engine)]
+
+    # Every worker process would load its own copy of the PaddleOCR model, so
+    # Paddle runs stay here and process the images sequentially (PaddleOCR
+    # threads internally). Only a model that actually loaded counts; otherwise
+    # the batch goes to Tesseract workers.
+    if engine != "tesseract" and PADDLE_INSTALLED and get_ocr_processor().resolved_engine(engine) == "paddle":
+        return [_result_to_dict(result) for result in get_ocr_processor().process_images(image_paths, engine)]
+
+    max_workers = max_workers or min(len(image_paths), os.cpu_count() or 1)
+    chunk_size = -(-len(image_paths) // max_workers)
+    chunks = [image_paths[i:i + chunk_size] for i in range(0, len(image_paths), chunk_size)]
+
+    if executor is not None:
+        chunk_results = executor.map(_process_image_chunk, chunks, repeat(engine))
+        return [result for chunk in chunk_results for result in chunk]
+
+    with create_ocr_worker_pool(max_workers) as executor:
+        chunk_results = executor.map(_process_image_chunk, chunks, repeat(engine))
+        return [result for chunk in chunk_results for result in chunk]
+
+
 if __name__ == "__main__":
     # Test code
     test_image = "test_image.jpg"
@@ -28,7 +28,7 @@ conda activate llmap
 echo "📦 Installing Python packages..."
 pip install fastapi uvicorn python-multipart pillow pytesseract
 pip install opencv-python geopy requests python-dotenv aiofiles
-pip install numpy scikit-image nltk jieba
+pip install numpy nltk jieba
 
 # Check if Tesseract is installed
 echo "🔍 Checking for Tesseract OCR..."
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Shared Test Fixtures
+Heavy OCR objects and test input files, loaded once and reused by every test
+in the session. The OCR stack is only imported by the fixtures that need it.
+"""
+
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+
+# Image types the scripts read from the test data
+IMAGE_SUFFIXES = {'.png', '.jpg', '.jpeg'}
+
+# process_image_files results already computed this session, by image content
+# and requested engine
+_IMAGE_RESULTS = {}
+
+
+def get_ocr_processor():
+    """The session OCRProcessor (the same instance process_image_file uses)"""
+    import ocr_processor
+    return ocr_processor.get_ocr_processor()
+
+
+@lru_cache(maxsize=1)
+def get_ground_truth_learner():
+    """The session ground truth pattern learner"""
+    from ocr_processor import GroundTruthPatternLearner
+    return GroundTruthPatternLearner()
+
+
+@lru_cache(maxsize=1)
+def get_text_filter():
+    """The session UI/noise text filter"""
+    from ocr_processor import IntelligentTextFilter
+    return IntelligentTextFilter()
+
+
+@lru_cache(maxsize=1)
+def get_location_classifier():
+    """The session location classifier, built on the shared pattern learner"""
+    from ocr_processor import LocationClassifier
+    return LocationClassifier(get_ground_truth_learner())
+
+
+@lru_cache(maxsize=8)
+def list_image_files(root: Path) -> tuple:
+    """Sample images under root, recursively, in path order; each tree is walked once per session"""
+    return tuple(sorted(path for path in root.rglob('*') if path.suffix.lower() in IMAGE_SUFFIXES))
+
+
+def preview_text(text: str, limit: int = 100) -> str:
+    """The first `limit` characters of text, with "..." when it was cut"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+@lru_cache(maxsize=32)
+def _read_bytes(path: str, mtime_ns: int) -> bytes:
+    """File contents for one (path, modification time) pair"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def read_file_bytes(path: str) -> bytes:
+    """Contents of a test input file, re-read only after it changes on disk"""
+    path = os.path.abspath(path)
+    return _read_bytes(path, os.stat(path).st_mtime_ns)
+
+
+def process_image_files_once(image_paths, engine="auto"):
+    """
+    process_image_files for a session of tests: images whose bytes were already
+    OCR'd with the same engine reuse that result (treat it as read-only), and
+    only the rest go to the worker pool
+    """
+    from ocr_processor import process_image_files
+    
+    keys = [
+        (blake2b(read_file_bytes(path), digest_size=16).digest(), engine)
+        for path in image_paths
+    ]
+    pending = {}  # key -> path, one path per distinct image
+    for path, key in zip(image_paths, keys):
+        if key not in _IMAGE_RESULTS:
+            pending.setdefault(key, path)
+    if pending:
+        results = process_image_files(list(pending.values()), engine)
+        _IMAGE_RESULTS.update(zip(pending, results))
+    return [_IMAGE_RESULTS[key] for key in keys]
+
+
+def read_image(image_path):
+    """Decode an image straight from a read-only memory map of its file"""
+    import cv2
+    import numpy as np
+    
+    with open(image_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            encoded = np.frombuffer(mm, dtype=np.uint8)
+            image = cv2.imdecode(encoded, cv2.IMREAD_COLOR)
+            # Drop the view before the map closes
+            del encoded
+    return image
+
+
+def prefetch_images(image_paths, buffer=2):
+    """
+    Yield (path, future of read_image(path)) in order. Up to `buffer` images
+    are read and decoded on a background thread while the caller OCRs the
+    current one; future.result() raises if reading that image failed.
+    """
+    paths = iter(image_paths)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = deque()
+        for path in paths:
+            pending.append((path, executor.submit(read_image, path)))
+            if len(pending) > buffer:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
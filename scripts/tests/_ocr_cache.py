@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+OCR Result Disk Cache
+The debug scripts re-run on the same images while downstream code changes, so
+the OCR engine output is cached per image and only post-processing runs again
+"""
+
+import json
+import os
+from dataclasses import asdict
+from hashlib import blake2b
+from pathlib import Path
+from typing import Dict, List
+
+from ocr_processor import OCRResult, ProcessedOCRResult, _result_to_dict
+
+# Cache location; bump CACHE_VERSION when preprocessing or the engines change
+CACHE_DIR = Path(os.environ.get("OCR_CACHE_DIR", ".ocr_cache"))
+CACHE_VERSION = 1
+
+
+def _cache_file(image_path: str, engine_used: str) -> Path:
+    """Cache entry for an image's bytes and the engine that OCRs it"""
+    digest = blake2b(Path(image_path).read_bytes(), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}_{engine_used}_v{CACHE_VERSION}.json"
+
+
+def _load(cache_file: Path):
+    """(visual image type, OCRResult) from a cache entry, or None on a miss"""
+    if not cache_file.exists():
+        return None
+    cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    ocr_result = OCRResult(**cached["ocr_result"])
+    if ocr_result.bbox is not None:
+        ocr_result.bbox = tuple(ocr_result.bbox)
+    return cached["image_type"], ocr_result
+
+
+def _store(cache_file: Path, image_type: str, ocr_result: OCRResult):
+    """Write a cache entry; empty OCR output is not cached so failures get retried"""
+    if not ocr_result.text.strip():
+        return
+    CACHE_DIR.mkdir(exist_ok=True)
+    cache_file.write_text(
+        json.dumps({"image_type": image_type, "ocr_result": asdict(ocr_result)}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+
+
+def _cache_get(image_path: str, engine_used: str):
+    """process_images cache_get hook: the disk entry for an image, or None"""
+    return _load(_cache_file(image_path, engine_used))
+
+
+def _cache_put(image_path: str, engine_used: str, image_type: str, ocr_result: OCRResult):
+    """process_images cache_put hook: write the disk entry for an image"""
+    _store(_cache_file(image_path, engine_used), image_type, ocr_result)
+
+
+def cached_process_images(processor, image_paths: List[str], engine: str = "auto") -> List[ProcessedOCRResult]:
+    """
+    processor.process_images with the OCR engine output also cached on disk,
+    so reruns of a script only redo text post-processing
+    """
+    return processor.process_images(image_paths, engine, cache_get=_cache_get, cache_put=_cache_put)
+
+
+def cached_process_image_files(processor, image_paths: List[str], engine: str = "auto") -> List[Dict]:
+    """process_image_files-style result dictionaries, backed by the OCR cache"""
+    return [_result_to_dict(result) for result in cached_process_images(processor, image_paths, engine)]
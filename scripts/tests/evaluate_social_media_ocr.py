@@ -7,26 +7,61 @@ Evaluates OCR performance against ground truth data
 import sys
 import os
 import json
-from typing import Dict, List, Tuple
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # Add backend to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
 
 from ocr_processor import OCRProcessor
 
+# Everything that is not a word character, dropped from dedup keys
+NON_WORD_RE = re.compile(r'\W+')
+
 def load_ground_truth(file_path: str) -> Dict:
     """Load ground truth data from JSON file"""
     with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        ground_truth = json.load(f)
+    
+    # Lowercase the expected text once here rather than on every evaluation
+    for image_data in ground_truth.get('images', {}).values():
+        image_data['_contains_lower'] = [text.lower() for text in image_data.get('expected_text_contains', [])]
+    
+    return ground_truth
 
 def normalize_text(text: str) -> str:
     """Normalize text for comparison"""
     return text.lower().strip().replace(' ', '')
 
-def calculate_text_similarity(expected: str, actual: str) -> float:
-    """Calculate simple text similarity score"""
-    expected_norm = normalize_text(expected)
-    actual_norm = normalize_text(actual)
+def canonical_key(text: str) -> str:
+    """Dedup key for extracted locations: lowercase word characters only"""
+    return NON_WORD_RE.sub('', text.lower())
+
+@lru_cache(maxsize=4096)
+def _norm_and_set(text: str) -> Tuple[str, FrozenSet[str]]:
+    """Normalized text and its character set, computed once per string"""
+    norm = normalize_text(text)
+    return norm, frozenset(norm)
+
+def _normalized_similarity(expected: Tuple[str, FrozenSet[str]], actual: Tuple[str, FrozenSet[str]]) -> float:
+    """Similarity score between two (normalized text, character set) pairs"""
+    expected_norm, expected_chars = expected
+    actual_norm, actual_chars = actual
     
     if not expected_norm:
         return 1.0 if not actual_norm else 0.0
@@ -35,16 +70,51 @@ def calculate_text_similarity(expected: str, actual: str) -> float:
         return 1.0
     
     # Simple character overlap
-    common_chars = set(expected_norm) & set(actual_norm)
-    total_chars = set(expected_norm) | set(actual_norm)
+    total_chars = len(expected_chars | actual_chars)
     
-    return len(common_chars) / len(total_chars) if total_chars else 0.0
+    return len(expected_chars & actual_chars) / total_chars if total_chars else 0.0
+
+def calculate_text_similarity(expected: str, actual: str) -> float:
+    """Calculate simple text similarity score"""
+    return _normalized_similarity(_norm_and_set(expected), _norm_and_set(actual))
+
+def find_containing_locations(expected_norms: List[str], actual_norms: List[str]) -> Dict[int, int]:
+    """Map each expected index to the first actual index whose text contains it.
+
+    Uses one Aho-Corasick pass per extracted location when pyahocorasick is
+    installed; without it no shortcut hits are returned.
+    """
+    first_hit = {}
+    if not AHOCORASICK_AVAILABLE:
+        return first_hit
+    
+    automaton = ahocorasick.Automaton()
+    for i, norm in enumerate(expected_norms):
+        if not norm:
+            continue
+        if norm in automaton:
+            automaton.get(norm).append(i)
+        else:
+            automaton.add_word(norm, [i])
+    if not len(automaton):
+        return first_hit
+    automaton.make_automaton()
+    
+    for j, actual_norm in enumerate(actual_norms):
+        for _, indices in automaton.iter(actual_norm):
+            for i in indices:
+                first_hit.setdefault(i, j)
+        if len(first_hit) == len(expected_norms):
+            break
+    return first_hit
 
 def evaluate_location_extraction(expected_locations: List[Dict], actual_locations: List[str]) -> Dict:
     """Evaluate location extraction performance"""
     results = {
         'total_expected': len(expected_locations),
         'total_extracted': len(actual_locations),
+        'distinct_extracted': 0,
+        'matched_extracted': 0,
         'correctly_identified': 0,
         'false_positives': 0,
         'missed_locations': [],
@@ -54,34 +124,55 @@ def evaluate_location_extraction(expected_locations: List[Dict], actual_location
         'f1_score': 0.0
     }
     
+    # Normalize every extracted location once instead of once per expected location
+    actual_normalized = [_norm_and_set(actual_loc) for actual_loc in actual_locations]
+    expected_normalized = [_norm_and_set(expected_loc['text']) for expected_loc in expected_locations]
+    
+    # Exact containment hits from a single dictionary scan; similarity only
+    # needs checking against the extracted locations before the first hit
+    containing = find_containing_locations(
+        [norm for norm, _ in expected_normalized],
+        [norm for norm, _ in actual_normalized],
+    )
+    
     # Check each expected location
-    for expected_loc in expected_locations:
+    for i, expected_loc in enumerate(expected_locations):
         expected_text = expected_loc['text']
-        found = False
+        expected_norm = expected_normalized[i]
+        match = None
         
-        for actual_loc in actual_locations:
-            similarity = calculate_text_similarity(expected_text, actual_loc)
+        hit = containing.get(i, len(actual_locations))
+        for j in range(hit):
+            similarity = _normalized_similarity(expected_norm, actual_normalized[j])
             if similarity > 0.5:  # Threshold for match
-                results['correctly_identified'] += 1
-                results['found_locations'].append({
-                    'expected': expected_text,
-                    'actual': actual_loc,
-                    'similarity': similarity,
-                    'type': expected_loc['type']
-                })
-                found = True
+                match = (actual_locations[j], similarity)
                 break
         
-        if not found:
+        if match is None and hit < len(actual_locations):
+            match = (actual_locations[hit], 1.0)
+        
+        if match is not None:
+            results['correctly_identified'] += 1
+            results['found_locations'].append({
+                'expected': expected_text,
+                'actual': match[0],
+                'similarity': match[1],
+                'type': expected_loc['type']
+            })
+        else:
             results['missed_locations'].append(expected_loc)
     
-    # Calculate false positives
-    matched_actual = {loc['actual'] for loc in results['found_locations']}
-    results['false_positives'] = len(actual_locations) - len(matched_actual)
+    # False positives and precision are over distinct extractions, so the same
+    # location extracted twice (or with different case/punctuation) counts once
+    matched_actual = {canonical_key(loc['actual']) for loc in results['found_locations']}
+    distinct_actual = {canonical_key(actual_loc) for actual_loc in actual_locations}
+    results['distinct_extracted'] = len(distinct_actual)
+    results['matched_extracted'] = len(matched_actual)
+    results['false_positives'] = len(distinct_actual) - len(matched_actual)
     
     # Calculate metrics
-    if results['total_extracted'] > 0:
-        results['precision'] = results['correctly_identified'] / results['total_extracted']
+    if results['distinct_extracted'] > 0:
+        results['precision'] = results['matched_extracted'] / results['distinct_extracted']
     
     if results['total_expected'] > 0:
         results['recall'] = results['correctly_identified'] / results['total_expected']
@@ -91,8 +182,9 @@ def evaluate_location_extraction(expected_locations: List[Dict], actual_location
     
     return results
 
-def evaluate_text_content(expected_contains: List[str], actual_text: str) -> Dict:
-    """Evaluate if expected text content is present"""
+def evaluate_text_content(expected_contains: List[str], actual_text: str,
+                          expected_lower: Optional[List[str]] = None) -> Dict:
+    """Evaluate if expected text content is present (expected_lower: pre-lowercased expected_contains)"""
     results = {
         'total_expected': len(expected_contains),
         'found_count': 0,
@@ -102,9 +194,10 @@ def evaluate_text_content(expected_contains: List[str], actual_text: str) -> Dic
     }
     
     actual_text_norm = actual_text.lower()
+    if expected_lower is None:
+        expected_lower = [expected_text.lower() for expected_text in expected_contains]
     
-    for expected_text in expected_contains:
-        expected_norm = expected_text.lower()
+    for expected_text, expected_norm in zip(expected_contains, expected_lower):
         if expected_norm in actual_text_norm:
             results['found_count'] += 1
             results['found_items'].append(expected_text)
@@ -139,7 +232,7 @@ def evaluate_single_image(image_path: str, ground_truth: Dict, processor: OCRPro
         location_eval = evaluate_location_extraction(expected_locations, actual_locations)
         
         # Evaluate text content
-        text_eval = evaluate_text_content(expected_text_contains, actual_text)
+        text_eval = evaluate_text_content(expected_text_contains, actual_text, ground_truth.get('_contains_lower'))
         
         # Overall evaluation
         evaluation = {
@@ -179,6 +272,20 @@ def evaluate_single_image(image_path: str, ground_truth: Dict, processor: OCRPro
             'error': str(e)
         }
 
+# OCR processor used by the evaluation workers. With fork it is built once in
+# the parent and inherited copy-on-write; otherwise each worker builds its own.
+_worker_processor = None
+
+def _init_worker():
+    """Build the worker's OCR processor unless it was inherited from the parent"""
+    global _worker_processor
+    if _worker_processor is None:
+        _worker_processor = OCRProcessor()
+
+def _evaluate_in_worker(image_path: str, ground_truth: Dict) -> Dict:
+    """Evaluate one image with the worker's OCR processor"""
+    return evaluate_single_image(image_path, ground_truth, _worker_processor)
+
 def main():
     """Main evaluation function"""
     print("🔍 Social Media OCR Evaluation")
@@ -193,11 +300,9 @@ def main():
     ground_truth = load_ground_truth(ground_truth_path)
     print(f"📋 Loaded ground truth for {len(ground_truth['images'])} images")
     
-    # Initialize OCR processor
-    processor = OCRProcessor()
-    
-    # Evaluate each image
-    evaluations = []
+    # Collect the images to evaluate
+    image_paths = []
+    expected_items = []
     social_media_dir = 'data/social media'
     
     for image_filename, expected_data in ground_truth['images'].items():
@@ -207,8 +312,22 @@ def main():
             print(f"⚠️  Image not found: {image_path}")
             continue
         
-        evaluation = evaluate_single_image(image_path, expected_data, processor)
-        evaluations.append(evaluation)
+        image_paths.append(image_path)
+        expected_items.append(expected_data)
+    
+    # Evaluate the images in parallel, one OCR processor per worker process;
+    # map() keeps the results in ground truth order
+    evaluations = []
+    if image_paths:
+        workers = min(len(image_paths), os.cpu_count() or 1)
+        if 'fork' in multiprocessing.get_all_start_methods():
+            # Load the OCR models once here; forked workers share the pages
+            context = multiprocessing.get_context('fork')
+            _init_worker()
+        else:
+            context = None
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as executor:
+            evaluations = list(executor.map(_evaluate_in_worker, image_paths, expected_items))
     
     # Calculate overall statistics
     successful_evals = [e for e in evaluations if e.get('success', False)]
@@ -229,15 +348,18 @@ def main():
     total_expected_locations = sum(e['location_extraction']['total_expected'] for e in successful_evals)
     total_found_locations = sum(e['location_extraction']['correctly_identified'] for e in successful_evals)
     total_extracted_locations = sum(e['location_extraction']['total_extracted'] for e in successful_evals)
+    # Precision counts each distinct extraction once, as in the per-image results
+    distinct_extracted_locations = sum(e['location_extraction']['distinct_extracted'] for e in successful_evals)
+    matched_extracted_locations = sum(e['location_extraction']['matched_extracted'] for e in successful_evals)
     
-    overall_precision = total_found_locations / total_extracted_locations if total_extracted_locations > 0 else 0
+    overall_precision = matched_extracted_locations / distinct_extracted_locations if distinct_extracted_locations > 0 else 0
     overall_recall = total_found_locations / total_expected_locations if total_expected_locations > 0 else 0
     overall_f1 = 2 * (overall_precision * overall_recall) / (overall_precision + overall_recall) if (overall_precision + overall_recall) > 0 else 0
     
     print(f"📍 Location Extraction:")
     print(f"   - Total Expected: {total_expected_locations}")
     print(f"   - Total Found: {total_found_locations}")
-    print(f"   - Total Extracted: {total_extracted_locations}")
+    print(f"   - Total Extracted: {total_extracted_locations} ({distinct_extracted_locations} distinct)")
     print(f"   - Precision: {overall_precision:.3f}")
     print(f"   - Recall: {overall_recall:.3f}")
     print(f"   - F1 Score: {overall_f1:.3f}")
@@ -268,25 +390,31 @@ def main():
     
     # Save detailed results
     results_file = 'data/social_media_evaluation_results.json'
-    with open(results_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'evaluation_date': '2025-01-18',
-            'overall_stats': {
-                'total_images': len(successful_evals),
-                'avg_ocr_confidence': avg_confidence,
-                'location_extraction': {
-                    'precision': overall_precision,
-                    'recall': overall_recall,
-                    'f1_score': overall_f1,
-                    'total_expected': total_expected_locations,
-                    'total_found': total_found_locations,
-                    'total_extracted': total_extracted_locations
-                },
-                'text_content_accuracy': text_accuracy,
-                'content_type_breakdown': content_types
+    results = {
+        'evaluation_date': '2025-01-18',
+        'overall_stats': {
+            'total_images': len(successful_evals),
+            'avg_ocr_confidence': avg_confidence,
+            'location_extraction': {
+                'precision': overall_precision,
+                'recall': overall_recall,
+                'f1_score': overall_f1,
+                'total_expected': total_expected_locations,
+                'total_found': total_found_locations,
+                'total_extracted': total_extracted_locations,
+                'distinct_extracted': distinct_extracted_locations
             },
-            'individual_results': evaluations
-        }, f, indent=2, ensure_ascii=False)
+            'text_content_accuracy': text_accuracy,
+            'content_type_breakdown': content_types
+        },
+        'individual_results': evaluations
+    }
+    if ORJSON_AVAILABLE:
+        with open(results_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(results_file, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
     
     print(f"\n💾 Detailed results saved to: {results_file}")
     
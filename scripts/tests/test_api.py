@@ -4,59 +4,78 @@ Test the API directly
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import os
+import glob
 
-def test_api():
-    """Test the OCR API with a sample image"""
+# /api/ocr/batch accepts at most this many files per request
+MAX_BATCH_FILES = 10
+
+def test_api(image_paths=None, session=None):
+    """Test the OCR API with the sample images, uploaded as one batch request"""
     
-    # Test with one image
-    image_path = "../data/google map/IMG_3193.PNG"
+    # Test with the Google Maps sample images
+    if image_paths is None:
+        image_paths = sorted(glob.glob("../data/google map/*.PNG"))[:MAX_BATCH_FILES]
     
-    if not os.path.exists(image_path):
-        print(f"Image not found: {image_path}")
+    image_paths = [path for path in image_paths if os.path.exists(path)]
+    if not image_paths:
+        print("No images found")
         return
     
     url = "http://localhost:8000/api/ocr/batch"
     
+    # Reuse one pooled connection across calls
+    if session is None:
+        session = requests.Session()
+        session.mount('http://', HTTPAdapter(pool_maxsize=16))
+    
+    handles = []
     try:
-        with open(image_path, 'rb') as f:
-            files = {'files': (os.path.basename(image_path), f, 'image/png')}
-            data = {
-                'engine': 'auto',
-                'enhance_image': 'true',
-                'extract_structured': 'true'
-            }
+        files = []
+        for image_path in image_paths:
+            handle = open(image_path, 'rb')
+            handles.append(handle)
+            files.append(('files', (os.path.basename(image_path), handle, 'image/png')))
+        data = {
+            'engine': 'auto',
+            'enhance_image': 'true',
+            'extract_structured': 'true'
+        }
+        
+        print(f"Testing API with {len(image_paths)} image(s): {', '.join(image_paths)}")
+        response = session.post(url, files=files, data=data)
+        
+        print(f"Status Code: {response.status_code}")
+        
+        if response.status_code == 200:
+            result = response.json()
+            print("API Response:")
+            print(f"  Success: {result.get('success', False)}")
+            print(f"  Processing Stats: {result.get('processing_stats', {})}")
             
-            print(f"Testing API with {image_path}")
-            response = requests.post(url, files=files, data=data)
+            if result.get('results'):
+                for i, file_result in enumerate(result['results']):
+                    print(f"  File {i+1}:")
+                    print(f"    Success: {file_result.get('success', False)}")
+                    print(f"    Confidence: {file_result.get('confidence', 0)}")
+                    print(f"    Raw text length: {len(file_result.get('raw_text', ''))}")
+                    print(f"    Extracted info: {file_result.get('extracted_info', {})}")
             
-            print(f"Status Code: {response.status_code}")
+            if result.get('aggregated_data'):
+                agg = result['aggregated_data']
+                print(f"  Aggregated locations: {len(agg.get('locations', []))}")
+                if agg.get('locations'):
+                    for loc in agg['locations'][:3]:
+                        print(f"    - {loc.get('name', 'Unknown')} ({loc.get('type', 'Unknown')})")
+        else:
+            print(f"Error: {response.text}")
             
-            if response.status_code == 200:
-                result = response.json()
-                print("API Response:")
-                print(f"  Success: {result.get('success', False)}")
-                print(f"  Processing Stats: {result.get('processing_stats', {})}")
-                
-                if result.get('results'):
-                    for i, file_result in enumerate(result['results']):
-                        print(f"  File {i+1}:")
-                        print(f"    Success: {file_result.get('success', False)}")
-                        print(f"    Confidence: {file_result.get('confidence', 0)}")
-                        print(f"    Raw text length: {len(file_result.get('raw_text', ''))}")
-                        print(f"    Extracted info: {file_result.get('extracted_info', {})}")
-                
-                if result.get('aggregated_data'):
-                    agg = result['aggregated_data']
-                    print(f"  Aggregated locations: {len(agg.get('locations', []))}")
-                    if agg.get('locations'):
-                        for loc in agg['locations'][:3]:
-                            print(f"    - {loc.get('name', 'Unknown')} ({loc.get('type', 'Unknown')})")
-            else:
-                print(f"Error: {response.text}")
-                
     except Exception as e:
         print(f"Error testing API: {e}")
+    finally:
+        for handle in handles:
+            handle.close()
 
 if __name__ == "__main__":
     test_api()
\ No newline at end of file
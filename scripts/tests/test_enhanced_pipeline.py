@@ -6,8 +6,17 @@ Tests the new architecture without requiring full dependency installation
 
 import sys
 import os
+import re
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from _fixtures import read_file_bytes
+
 # Add backend to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
@@ -109,8 +118,8 @@ def test_api_structure():
             print("  ❌ main.py not found")
             return False
         
-        with open(main_py_path, 'r') as f:
-            content = f.read()
+        # The source is only searched for ASCII tokens, so skip decoding it
+        content = read_file_bytes(main_py_path)
         
         # Check for Enhanced OCR + AI Pipeline endpoints
         endpoints_to_check = [
@@ -121,8 +130,14 @@ def test_api_structure():
             'IntelligentGeocoder'
         ]
         
+        # One scan over the source for all tokens; the zero-width lookahead tries
+        # every position, so tokens that overlap each other are all found
+        tokens = sorted((endpoint.encode() for endpoint in endpoints_to_check), key=len, reverse=True)
+        pattern = re.compile(b'(?=(' + b'|'.join(map(re.escape, tokens)) + b'))')
+        found = {match.group(1) for match in pattern.finditer(content)}
+        
         for endpoint in endpoints_to_check:
-            if endpoint in content:
+            if endpoint.encode() in found:
                 print(f"    ✅ Found: {endpoint}")
             else:
                 print(f"    ❌ Missing: {endpoint}")
@@ -145,8 +160,8 @@ def test_ground_truth_data():
             print("  ❌ Ground truth file not found")
             return False
         
-        with open(ground_truth_path, 'r') as f:
-            ground_truth = json.load(f)
+        raw = read_file_bytes(ground_truth_path)
+        ground_truth = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
         
         images = ground_truth.get('images', {})
         print(f"    ✅ Ground truth loaded: {len(images)} test images")
@@ -178,12 +193,11 @@ def test_documentation():
         for doc_path in docs_to_check:
             full_path = os.path.join(os.path.dirname(__file__), '..', doc_path)
             if os.path.exists(full_path):
-                with open(full_path, 'r') as f:
-                    content = f.read()
-                    if 'Enhanced OCR + AI Pipeline' in content:
-                        print(f"    ✅ Updated: {doc_path}")
-                    else:
-                        print(f"    ⚠️  Partially updated: {doc_path}")
+                content = read_file_bytes(full_path)
+                if b'Enhanced OCR + AI Pipeline' in content:
+                    print(f"    ✅ Updated: {doc_path}")
+                else:
+                    print(f"    ⚠️  Partially updated: {doc_path}")
             else:
                 print(f"    ❌ Missing: {doc_path}")
         
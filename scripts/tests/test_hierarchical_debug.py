@@ -3,17 +3,51 @@
 Debug script to test hierarchical extraction directly
 """
 
+import io
 import sys
 import os
 import logging
+import re
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from ocr_processor import GroundTruthPatternLearner, LocationClassifier, IntelligentTextFilter
-import re
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+from _fixtures import get_ground_truth_learner, get_location_classifier, get_text_filter
 
 # Set up logging to see debug output
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
 
+# Literal uppercase letters in a pattern source, skipping escapes like \S or \W
+PATTERN_CASE_RE = re.compile(r'\\.|[A-Z]')
+
+def lowercase_pattern(regex):
+    """Case-sensitive equivalent of an IGNORECASE regex, for lowercased text"""
+    source = PATTERN_CASE_RE.sub(
+        lambda m: m.group() if m.group().startswith('\\') else m.group().lower(),
+        regex.pattern,
+    )
+    return re.compile(source)
+
+# Plain lowercase text at the start of a pattern source
+LITERAL_PREFIX_RE = re.compile(r'[a-z0-9 ]+')
+
+def literal_prefix(source):
+    """Text every match of a lowercase pattern starts with ('' if none)"""
+    if '|' in source:
+        return ''
+    match = LITERAL_PREFIX_RE.match(source)
+    if not match:
+        return ''
+    prefix = match.group()
+    # A quantifier makes the last character optional
+    if source[match.end():match.end() + 1] in ('?', '*', '{'):
+        prefix = prefix[:-1]
+    return prefix
+
 def test_pattern_matching():
     """Test pattern matching with known text samples"""
     
@@ -35,53 +69,101 @@ def test_pattern_matching():
         ("Acme Bread", "<e BENS ghee, z NEY FES AYE ke McDonaldsxQHy o\\ s\\n i. Vs: AW PAY Fe: ae es Acme Bread () x 48 (1, 278) - Bakery - - - Opens 08:00 Thu Saved in 1% . | 1) 2 Ses et ee ed \"i8- <a), Ee Overview Menu")
     ]
     
-    # Create the pattern learner
-    gt_learner = GroundTruthPatternLearner()
-    filter_tool = IntelligentTextFilter()
-    classifier = LocationClassifier(gt_learner)
+    # Shared pattern learner, filter and classifier
+    gt_learner = get_ground_truth_learner()
+    filter_tool = get_text_filter()
+    classifier = get_location_classifier()
+    
+    # The learner's patterns compiled once, grouped by business, for every
+    # sample; each also gets a lowercase form that scans lowercased text
+    # without case folding every character for every pattern
+    business_regexes = {}
+    for regex, business, _ in gt_learner.compiled_business_patterns:
+        regex_lower = lowercase_pattern(regex)
+        business_regexes.setdefault(business, []).append(
+            (regex, regex_lower, literal_prefix(regex_lower.pattern))
+        )
+    
+    # A pattern can only match where its literal prefix occurs, so one
+    # automaton pass per sample rules out most patterns without running them
+    prefixes = {prefix for regexes in business_regexes.values() for _, _, prefix in regexes if prefix}
+    prefix_automaton = None
+    if AHOCORASICK_AVAILABLE and prefixes:
+        prefix_automaton = ahocorasick.Automaton()
+        for prefix in prefixes:
+            prefix_automaton.add_word(prefix, prefix)
+        prefix_automaton.make_automaton()
+    
+    # Report lines are collected per sample and written out in one call
+    out = io.StringIO()
+    
+    def flush_output():
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+        out.seek(0)
+        out.truncate(0)
     
     for i, (expected_business, text) in enumerate(test_texts, 1):
-        print(f"\n{'='*60}")
-        print(f"Testing Text Sample {i} - Looking for: {expected_business}")
-        print(f"{'='*60}")
-        print(f"Text: {text[:100]}...")
-        print(f"Full length: {len(text)} characters")
+        print(f"\n{'='*60}", file=out)
+        print(f"Testing Text Sample {i} - Looking for: {expected_business}", file=out)
+        print(f"{'='*60}", file=out)
+        print(f"Text: {text[:100]}...", file=out)
+        print(f"Full length: {len(text)} characters", file=out)
+        
+        # Lowercase once per sample; match spans map straight back to the
+        # original text unless lowering changed its length
+        text_lower = text.lower()
+        scan_lowered = len(text_lower) == len(text)
+        if prefix_automaton is not None:
+            present_prefixes = {prefix for _, prefix in prefix_automaton.iter(text_lower)}
+        else:
+            present_prefixes = {prefix for prefix in prefixes if prefix in text_lower}
         
         # Test individual business patterns
-        print(f"\nTesting business pattern matching:")
+        print(f"\nTesting business pattern matching:", file=out)
         found_any = False
         
-        for business, data in gt_learner.known_businesses.items():
-            print(f"  Looking for: {business}")
-            for pattern in data["patterns"]:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+        for business, regexes in business_regexes.items():
+            print(f"  Looking for: {business}", file=out)
+            for regex, regex_lower, prefix in regexes:
+                pattern = regex.pattern
+                if scan_lowered and prefix and prefix not in present_prefixes:
+                    matches = ()
+                elif scan_lowered:
+                    matches = regex_lower.finditer(text_lower)
+                else:
+                    matches = regex.finditer(text)
                 match_found = False
                 for match in matches:
                     match_found = True
                     found_any = True
-                    match_text = match.group().strip()
-                    print(f"    ✅ Pattern '{pattern}' found: '{match_text}'")
+                    match_text = text[match.start():match.end()].strip()
+                    print(f"    ✅ Pattern '{pattern}' found: '{match_text}'", file=out)
                     
                     # Test filters
                     is_noise = filter_tool.is_ui_element(match_text)
-                    print(f"    Filters - UI Element: {is_noise}")
+                    print(f"    Filters - UI Element: {is_noise}", file=out)
                     
                 if not match_found:
-                    print(f"    ❌ Pattern '{pattern}' - NO MATCH")
+                    print(f"    ❌ Pattern '{pattern}' - NO MATCH", file=out)
         
         if not found_any:
-            print(f"  ⚠️  NO BUSINESS PATTERNS MATCHED!")
+            print(f"  ⚠️  NO BUSINESS PATTERNS MATCHED!", file=out)
             
-        # Test classifier on the whole text
-        print(f"\nTesting classifier on full text:")
+        # Test classifier on the whole text (flushed first so its log lines
+        # still come after the pattern results)
+        print(f"\nTesting classifier on full text:", file=out)
+        flush_output()
         classification = classifier.classify_text(text, 0.7)
-        print(f"  Classification: {classification}")
+        print(f"  Classification: {classification}", file=out)
         
         # Test simple string search for expected business
-        if expected_business.lower() in text.lower():
-            print(f"  ✅ Simple string search found '{expected_business}' in text")
+        if expected_business.lower() in text_lower:
+            print(f"  ✅ Simple string search found '{expected_business}' in text", file=out)
         else:
-            print(f"  ❌ Simple string search did NOT find '{expected_business}' in text")
+            print(f"  ❌ Simple string search did NOT find '{expected_business}' in text", file=out)
+        
+        flush_output()
 
 if __name__ == "__main__":
     test_pattern_matching()
\ No newline at end of file
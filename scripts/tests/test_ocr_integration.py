@@ -4,15 +4,34 @@ OCR Integration Test Script
 Test various functions of the OCR processor
 """
 
+import io
 import os
 import sys
 import json
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from ocr_processor import process_image_file, ocr_processor
+from ocr_processor import ImagePreprocessor, TextProcessor, get_ocr_processor
+from _fixtures import list_image_files, preview_text, process_image_files_once
+
+def flush_to_stdout(buffer: io.StringIO):
+    """Write a block of buffered report lines to stdout in one call and reset the buffer"""
+    sys.stdout.write(buffer.getvalue())
+    sys.stdout.flush()
+    buffer.seek(0)
+    buffer.truncate(0)
+
+def find_image_files(data_dir: Path) -> list:
+    """All sample images under data_dir in path order (the walk is shared by every test)"""
+    return list(list_image_files(data_dir))
 
 def test_ocr_engines():
     """Test OCR engine availability"""
@@ -22,7 +41,7 @@ def test_ocr_engines():
     print(f"  Tesseract: ✅ Available")
     
     # Test PaddleOCR
-    paddle_status = "✅ Available" if ocr_processor.paddle.available else "❌ Unavailable"
+    paddle_status = "✅ Available" if get_ocr_processor().paddle.available else "❌ Unavailable"
     print(f"  PaddleOCR: {paddle_status}")
     
     return True
@@ -38,9 +57,7 @@ def test_sample_images():
         return False
     
     # Find image files
-    image_files = []
-    for pattern in ["*.png", "*.jpg", "*.jpeg", "*.PNG", "*.JPG", "*.JPEG"]:
-        image_files.extend(data_dir.rglob(pattern))
+    image_files = find_image_files(data_dir)
     
     if not image_files:
         print("  ❌ No sample images found")
@@ -48,33 +65,41 @@ def test_sample_images():
     
     print(f"  Found {len(image_files)} image files")
     
-    # Test first 3 images
+    # Test first 3 images, submitted as one batch so reads and OCR overlap
+    sample_files = image_files[:3]
+    try:
+        results = process_image_files_once([str(image_path) for image_path in sample_files], "auto")
+    except Exception as e:
+        print(f"  ❌ Processing error: {e}")
+        return False
+    
+    # Each image's lines are collected and written out together
+    out = io.StringIO()
     success_count = 0
-    for i, image_path in enumerate(image_files[:3]):
-        print(f"\n  Processing image {i+1}: {image_path.name}")
+    for i, (image_path, result) in enumerate(zip(sample_files, results)):
+        print(f"\n  Processing image {i+1}: {image_path.name}", file=out)
         
         try:
-            result = process_image_file(str(image_path), "auto")
-            
             if result.get("success"):
-                print(f"    ✅ Processing successful")
-                print(f"    📝 Confidence: {result.get('confidence', 0):.2f}")
-                print(f"    📍 Extracted locations: {len(result.get('extracted_info', {}).get('locations', []))}")
-                print(f"    🏠 Extracted addresses: {len(result.get('extracted_info', {}).get('addresses', []))}")
-                print(f"    🏢 Extracted businesses: {len(result.get('extracted_info', {}).get('business_names', []))}")
+                print(f"    ✅ Processing successful", file=out)
+                print(f"    📝 Confidence: {result.get('confidence', 0):.2f}", file=out)
+                print(f"    📍 Extracted locations: {len(result.get('extracted_info', {}).get('locations', []))}", file=out)
+                print(f"    🏠 Extracted addresses: {len(result.get('extracted_info', {}).get('addresses', []))}", file=out)
+                print(f"    🏢 Extracted businesses: {len(result.get('extracted_info', {}).get('business_names', []))}", file=out)
                 
                 # Show partial extracted text
-                cleaned_text = result.get('cleaned_text', '')
+                cleaned_text = result['cleaned_text']
                 if cleaned_text:
-                    preview = cleaned_text[:100] + "..." if len(cleaned_text) > 100 else cleaned_text
-                    print(f"    📄 Text preview: {preview}")
+                    print(f"    📄 Text preview: {preview_text(cleaned_text, 100)}", file=out)
                 
                 success_count += 1
             else:
-                print(f"    ❌ Processing failed")
+                print(f"    ❌ Processing failed", file=out)
                 
         except Exception as e:
-            print(f"    ❌ Processing error: {e}")
+            print(f"    ❌ Processing error: {e}", file=out)
+        
+        flush_to_stdout(out)
     
     print(f"\n  Summary: {success_count}/3 images processed successfully")
     return success_count > 0
@@ -90,35 +115,43 @@ def test_text_processing():
         "Chinese test: Beijing Roast Duck Restaurant, Address: 123 Wangfujing Street, Phone: 010-12345678, Hours: 10:00-22:00"
     ]
     
+    # Text processing needs no OCR engine, so don't load one
+    text_processor = TextProcessor()
+    
+    # Each sample's lines are collected and written out together
+    out = io.StringIO()
+    
     for i, text in enumerate(test_texts):
-        print(f"\n  Test text {i+1}:")
-        print(f"    Original: {text}")
+        print(f"\n  Test text {i+1}:", file=out)
+        print(f"    Original: {text}", file=out)
         
         try:
             # Clean text
-            cleaned = ocr_processor.text_processor.clean_text(text)
-            print(f"    Cleaned: {cleaned}")
+            cleaned = text_processor.clean_text(text)
+            print(f"    Cleaned: {cleaned}", file=out)
             
             # Extract location information
-            locations = ocr_processor.text_processor.extract_locations_advanced(cleaned)
-            print(f"    Extracted locations: {len(locations)} items")
+            locations = text_processor.extract_locations_advanced(cleaned)
+            print(f"    Extracted locations: {len(locations)} items", file=out)
             for loc in locations[:3]:  # Only show first 3
-                print(f"      - {loc['text']} ({loc['type']}, confidence: {loc['confidence']:.2f})")
+                print(f"      - {loc['text']} ({loc['type']}, confidence: {loc['confidence']:.2f})", file=out)
             
             # Extract contact information
-            contact = ocr_processor.text_processor.extract_contact_info(cleaned)
+            contact = text_processor.extract_contact_info(cleaned)
             if contact['phones']:
-                print(f"    Phone: {contact['phones']}")
+                print(f"    Phone: {contact['phones']}", file=out)
             if contact['emails']:
-                print(f"    Email: {contact['emails']}")
+                print(f"    Email: {contact['emails']}", file=out)
             
             # Extract ratings
-            ratings = ocr_processor.text_processor.extract_ratings_and_reviews(cleaned)
+            ratings = text_processor.extract_ratings_and_reviews(cleaned)
             if ratings:
-                print(f"    Ratings: {[r['value'] for r in ratings]}")
+                print(f"    Ratings: {[r['value'] for r in ratings]}", file=out)
                 
         except Exception as e:
-            print(f"    ❌ Processing error: {e}")
+            print(f"    ❌ Processing error: {e}", file=out)
+        
+        flush_to_stdout(out)
     
     return True
 
@@ -128,7 +161,7 @@ def test_image_preprocessing():
     
     # Find a sample image
     data_dir = Path("data")
-    image_files = list(data_dir.rglob("*.png")) + list(data_dir.rglob("*.jpg"))
+    image_files = find_image_files(data_dir)
     
     if not image_files:
         print("  ❌ No test images found")
@@ -139,12 +172,13 @@ def test_image_preprocessing():
     
     try:
         # Test image preprocessing
-        processed_image = ocr_processor.preprocessor.preprocess_for_ocr(str(test_image))
+        preprocessor = ImagePreprocessor()
+        processed_image = preprocessor.preprocess_for_ocr(str(test_image))
         print(f"  ✅ Image preprocessing successful")
         print(f"  📐 Processed dimensions: {processed_image.shape}")
         
         # Test image type detection
-        image_type = ocr_processor.preprocessor.detect_image_type(processed_image)
+        image_type = preprocessor.detect_image_type(processed_image)
         print(f"  🔍 Detected image type: {image_type}")
         
         return True
@@ -161,7 +195,7 @@ def generate_test_report():
         "test_timestamp": "2024-01-01T00:00:00",
         "ocr_engines": {
             "tesseract": True,
-            "paddle": ocr_processor.paddle.available
+            "paddle": get_ocr_processor().paddle.available
         },
         "test_results": {
             "engine_test": True,
@@ -173,8 +207,13 @@ def generate_test_report():
     
     # Save report
     report_path = Path("ocr_test_report.json")
-    with open(report_path, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    # Serialized in memory and written with a single write either way
+    if ORJSON_AVAILABLE:
+        report_path.write_bytes(orjson.dumps(
+            report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ))
+    else:
+        report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
     
     print(f"  📄 Test report saved: {report_path}")
     return True